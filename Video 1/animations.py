@@ -0,0 +1,142 @@
+import numpy as np
+from manim import PI, Animation, Mobject, interpolate
+
+OPACITY_ARRAYS = ['fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas']
+
+
+class FadeOpacity(Animation):
+	# Sets the fill and stroke opacity of a mobject the way set_opacity does, by writing the alpha channels in
+	# place, so neither the mobject nor its points are ever copied. With a lag_ratio the submobjects fade one
+	# after another, each with the full rate_func.
+	def __init__(self, mobject, start_opacity=0, end_opacity=1, **kwargs):
+		self.start_opacity = start_opacity
+		self.end_opacity = end_opacity
+		self.parts = []
+		super().__init__(mobject, **kwargs)
+
+	def create_starting_mobject(self):
+		# only opacities change, so there is no starting state worth keeping
+		return Mobject()
+
+	def get_all_mobjects(self):
+		return [self.mobject]
+
+	def begin(self):
+		parts = self.mobject.submobjects or [self.mobject]
+		self.parts = [
+			[member for member in part.family_members_with_points() if hasattr(member, 'fill_rgbas')]
+			for part in parts
+		]
+		super().begin()
+
+	def interpolate_mobject(self, alpha):
+		for index, members in enumerate(self.parts):
+			sub_alpha = self.get_sub_alpha(alpha, index, len(self.parts))
+			opacity = interpolate(self.start_opacity, self.end_opacity, sub_alpha)
+			for member in members:
+				# looked up every frame, since a Transform playing alongside may replace these arrays
+				for name in OPACITY_ARRAYS:
+					getattr(member, name)[:, 3] = opacity
+				member.fill_opacity = member.stroke_opacity = member.background_stroke_opacity = opacity
+
+	def get_sub_alpha(self, alpha, index, num_submobjects):
+		full_length = (num_submobjects - 1) * self.lag_ratio + 1
+		return self.rate_func(np.clip(alpha * full_length - index * self.lag_ratio, 0, 1))
+
+
+def submobject_centers(group):
+	return np.array([part.get_center() for part in group.submobjects]).reshape(-1, 3)
+
+
+class MoveCenters(Animation):
+	# Translates each submobject of a group so that its center ends on the matching row of target_centers. The
+	# submobjects are only moved, never scaled, and a single animation drives the whole group.
+	def __init__(self, group, target_centers=None, **kwargs):
+		self.target_centers = target_centers
+		self.offsets = np.zeros((0, 3))
+		self.members = []
+		self.start_points = []
+		super().__init__(group, **kwargs)
+
+	def create_starting_mobject(self):
+		return Mobject()
+
+	def get_all_mobjects(self):
+		return [self.mobject]
+
+	def get_target_centers(self, centers):
+		return np.asarray(self.target_centers).reshape(-1, 3)
+
+	def begin(self):
+		centers = submobject_centers(self.mobject)
+		self.offsets = self.get_target_centers(centers) - centers
+		self.members = [part.family_members_with_points() for part in self.mobject.submobjects]
+		self.start_points = [[member.points.copy() for member in members] for members in self.members]
+		super().begin()
+
+	def interpolate_mobject(self, alpha):
+		shifts = self.offsets * self.rate_func(alpha)
+		for members, start_points, shift in zip(self.members, self.start_points, shifts):
+			for member, points in zip(members, start_points):
+				np.add(points, shift, out=member.points)
+
+
+class RadialScale(MoveCenters):
+	# Moves each submobject of a group along the ray from about_point through its center, so that its distance
+	# to about_point is multiplied by factor. Every target center comes from one NumPy operation when the
+	# animation begins.
+	def __init__(self, group, about_point, factor, **kwargs):
+		self.about_point = about_point
+		self.factor = factor
+		super().__init__(group, **kwargs)
+
+	def get_target_centers(self, centers):
+		about_point = self.about_point
+		if isinstance(about_point, Mobject):
+			about_point = about_point.get_center()
+		return about_point + (centers - about_point) * self.factor
+
+
+class TranslateTo(Animation):
+	# Moves a mobject rigidly so that its center ends on target, a point or the center of a mobject when the
+	# animation begins. It gives the same frames as a Transform between two copies of one shape, path_arc
+	# included, but keeps the mobject's own style, copies its points once and allocates nothing per frame.
+	def __init__(self, mobject, target, path_arc=0, **kwargs):
+		self.target = target
+		self.path_arc = path_arc
+		self.offset = np.zeros(3)
+		self.members = []
+		self.start_points = []
+		super().__init__(mobject, **kwargs)
+
+	def create_starting_mobject(self):
+		return Mobject()
+
+	def get_all_mobjects(self):
+		return [self.mobject]
+
+	def begin(self):
+		target = self.target.get_center() if isinstance(self.target, Mobject) else np.asarray(self.target)
+		self.start = self.mobject.get_center()
+		self.vect = target - self.start
+		# as in path_along_arc, every point turns by alpha * path_arc about the same arc center
+		self.arc_center = self.start + 0.5 * self.vect
+		if self.path_arc != 0 and self.path_arc != PI:
+			self.arc_center[:2] += np.array([-self.vect[1], self.vect[0]]) / 2 / np.tan(self.path_arc / 2)
+		self.relative = self.start - self.arc_center
+
+		self.members = self.mobject.family_members_with_points()
+		self.start_points = [member.points.copy() for member in self.members]
+		super().begin()
+
+	def interpolate_mobject(self, alpha):
+		alpha = self.rate_func(alpha)
+		if self.path_arc == 0:
+			np.multiply(self.vect, alpha, out=self.offset)
+		else:
+			cosine, sine = np.cos(alpha * self.path_arc), np.sin(alpha * self.path_arc)
+			self.offset[0] = self.arc_center[0] + cosine * self.relative[0] - sine * self.relative[1] - self.start[0]
+			self.offset[1] = self.arc_center[1] + sine * self.relative[0] + cosine * self.relative[1] - self.start[1]
+			self.offset[2] = alpha * self.vect[2]
+		for member, points in zip(self.members, self.start_points):
+			np.add(points, self.offset, out=member.points)
@@ -0,0 +1,41 @@
+import numpy as np
+from manim import VGroup
+
+
+def shortened_endpoints(starts, ends, scale_factor=0.9):
+	# endpoints of every segment after scaling it about its own midpoint
+	offsets = (1 - scale_factor) / 2 * (ends - starts)
+	return starts + offsets, ends - offsets
+
+
+class ArrowField:
+	# Keeps arrows[i] on the segment from dots[source] to dots[target] of pairs[i], shortened as shortened_endpoints
+	# does. A single updater on group gathers the dot centers once per frame and places every arrow.
+	def __init__(self, arrows, dots, pairs):
+		self.arrows = list(arrows)
+		self.dots = dots
+		self.group = VGroup(*self.arrows)
+		pairs = np.array(pairs, dtype=int).reshape(-1, 2)
+		self.sources = pairs[:, 0]
+		self.targets = pairs[:, 1]
+
+	def update_arrows(self, group):
+		centers = np.array([dot.get_center() for dot in self.dots])
+		starts, ends = shortened_endpoints(centers[self.sources], centers[self.targets])
+		for arrow, start, end in zip(self.arrows, starts, ends):
+			arrow.put_start_and_end_on(start, end)
+
+	def make_sticky(self):
+		# the updater sits on the group, so it is the group that has to be in the scene
+		self.group.add_updater(self.update_arrows)
+		return self.group
+
+	def make_normal(self):
+		self.group.clear_updaters()
+		return self.group
+
+
+def arrow_add_sticky_updater(arrow, dot1, dot2):
+	arrow.add_updater(
+		lambda mobject: mobject.put_start_and_end_on(*shortened_endpoints(dot1.get_center(), dot2.get_center()))
+	)
@@ -0,0 +1,150 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+
+from manim import __version__, config, logger, tempconfig
+
+from render_video import QUALITY_FLAGS, discover_scenes, quality_config, watch_plays
+from updater_profiler import profile_updaters
+
+BENCHMARK_MODULES = ['proof', 'intro', 'lcm', 'preamble', 'logo']
+BENCHMARK_QUALITIES = ['l', 'h']
+REGRESSION_TOLERANCE = 0.1
+
+
+def cache_stats(renderer):
+	from factorization import factorization_cache_info
+	from order_solver import solver_cache_info
+	from tex_cache import tex_geometry_cache
+
+	factorization = factorization_cache_info()
+	solver = solver_cache_info()
+	stats = {
+		'tex_geometry': tex_geometry_cache.stats(),
+		'factorization': {'hits': factorization.hits, 'misses': factorization.misses},
+		'order_solver': {'hits': solver.hits, 'misses': solver.misses},
+	}
+	if hasattr(renderer, 'reused_plays'):
+		stats['frame_reuse'] = {'plays': renderer.num_plays, 'reused_plays': renderer.reused_plays}
+	return stats
+
+
+def benchmark_scene(module_name, scene_name, quality, media_dir, profile=False):
+	# runs in a fresh worker process so that peak RSS and cache counters belong to this scene alone
+	module = importlib.import_module(module_name)
+	play_seconds = []
+	with tempconfig({
+		'input_file': module.__file__,
+		'media_dir': media_dir,
+		'disable_caching': True,
+		'progress_bar': 'none',
+		**quality_config(quality)
+	}):
+		scene = getattr(module, scene_name)()
+		renderer = scene.renderer
+		play_started = {}
+		watch_plays(
+			scene,
+			before_play=lambda index: play_started.__setitem__(index, time.perf_counter()),
+			after_play=lambda index: play_seconds.append(time.perf_counter() - play_started[index])
+		)
+		# opt in, since timing every updater call slows the render down
+		profiler = profile_updaters(scene) if profile else None
+
+		start = time.perf_counter()
+		try:
+			scene.render()
+		finally:
+			if profiler is not None:
+				profiler.uninstall()
+		wall_seconds = time.perf_counter() - start
+		frames = round(renderer.time * config['frame_rate'])
+
+	result = {
+		'wall_seconds': wall_seconds,
+		'play_seconds': play_seconds,
+		'frames': frames,
+		'fps': frames / wall_seconds if wall_seconds else 0.0,
+		# ru_maxrss is in KiB on Linux
+		'peak_rss_mib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+		'caches': cache_stats(renderer),
+	}
+	if profiler is not None:
+		result['updaters'] = profiler.report()
+	return result
+
+
+def run_benchmarks(scenes, qualities, media_dir, profile=False):
+	results = {}
+	context = multiprocessing.get_context('spawn')
+	for quality in qualities:
+		for module_name, scene_name in scenes:
+			name = f'{module_name}.{scene_name}'
+			with context.Pool(processes=1) as pool:
+				try:
+					result = pool.apply(
+						benchmark_scene, (module_name, scene_name, QUALITY_FLAGS[quality], media_dir, profile)
+					)
+				except Exception as error:
+					logger.error(f'Benchmark of {name} at -q{quality} failed: {error}')
+					result = {'error': repr(error)}
+			results.setdefault(quality, {})[name] = result
+			if 'error' not in result:
+				logger.info(f"{name} -q{quality}: {result['wall_seconds']:.1f}s, {result['fps']:.1f} fps")
+	return results
+
+
+def compare(results, baseline, tolerance):
+	# scenes whose wall time grew by more than tolerance relative to the baseline
+	regressions = []
+	for quality, scenes in results.items():
+		for name, result in scenes.items():
+			before = baseline.get(quality, {}).get(name)
+			if before is None or 'error' in before or 'error' in result:
+				continue
+			ratio = result['wall_seconds'] / before['wall_seconds']
+			logger.info(f'{name} -q{quality}: {ratio:.2f}x baseline wall time')
+			if ratio > 1 + tolerance:
+				regressions.append((quality, name, ratio))
+	return regressions
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Benchmark rendering every scene of the video.')
+	parser.add_argument('-q', '--quality', nargs='+', choices=sorted(QUALITY_FLAGS), default=BENCHMARK_QUALITIES)
+	parser.add_argument('--scenes', nargs='+', help='only these scenes, given as module.Scene')
+	parser.add_argument('--media_dir', help='defaults to a fresh temporary directory, so every cache starts cold')
+	parser.add_argument('-o', '--output', default='benchmark.json')
+	parser.add_argument('--baseline', help='an earlier output to compare against')
+	parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE)
+	parser.add_argument('--profile_updaters', action='store_true', help='time every updater, split by play')
+	args = parser.parse_args()
+
+	scenes = sorted(discover_scenes(BENCHMARK_MODULES))
+	if args.scenes:
+		scenes = [scene for scene in scenes if '.'.join(scene) in args.scenes]
+
+	media_dir = args.media_dir or tempfile.mkdtemp(prefix='manim_benchmark_')
+	results = run_benchmarks(scenes, args.quality, media_dir, args.profile_updaters)
+
+	with open(args.output, 'w') as file:
+		json.dump({'manim_version': __version__, 'python_version': sys.version, 'results': results}, file, indent=4)
+	logger.info(f'Benchmark results written to {args.output}')
+
+	if args.baseline:
+		with open(args.baseline) as file:
+			baseline = json.load(file)['results']
+		regressions = compare(results, baseline, args.tolerance)
+		for quality, name, ratio in regressions:
+			logger.error(f'{name} -q{quality} regressed to {ratio:.2f}x its baseline wall time')
+		if regressions:
+			sys.exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,73 @@
+import ast
+import hashlib
+import inspect
+import os
+import shutil
+
+from manim import __version__, config, logger
+
+
+def local_module_paths(module_file):
+	# the file of the scene's module and of every module next to it that it imports, directly or through another one
+	directory = os.path.dirname(os.path.abspath(module_file))
+	paths = []
+	pending = [os.path.abspath(module_file)]
+	while pending:
+		path = pending.pop()
+		if path in paths:
+			continue
+		paths.append(path)
+		with open(path, encoding='utf-8') as file:
+			tree = ast.parse(file.read())
+		for node in ast.walk(tree):
+			if isinstance(node, ast.Import):
+				names = [alias.name for alias in node.names]
+			elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+				names = [node.module]
+			else:
+				continue
+			for name in names:
+				candidate = os.path.join(directory, name.split('.')[0] + '.py')
+				if os.path.exists(candidate):
+					pending.append(candidate)
+	return sorted(paths)
+
+
+def scene_source(scene_class):
+	# the whole source the scene runs, leaving out manim's own: its module, with every constant and helper in it,
+	# and every module of the video it imports
+	sources = [scene_class.__qualname__]
+	for path in local_module_paths(inspect.getsourcefile(scene_class)):
+		with open(path, encoding='utf-8') as file:
+			sources.append(f'{os.path.basename(path)}\n{file.read()}')
+	return '\n'.join(sources)
+
+
+def clip_key(scene_class, settings):
+	description = repr((
+		__version__,
+		scene_source(scene_class),
+		sorted(settings.items()),
+		str(config['background_color']),
+		config['transparent'],
+		config['movie_file_extension'],
+	))
+	return hashlib.sha256(description.encode()).hexdigest()
+
+
+def clip_path(clip_dir, scene_class, settings):
+	extension = config['movie_file_extension']
+	return os.path.join(clip_dir, f'{scene_class.__name__}_{clip_key(scene_class, settings)[:16]}{extension}')
+
+
+def store_clip(movie_file, path):
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	# copied under a temporary name first so that a concurrent render never splices half a clip
+	temporary_path = f'{path}.{os.getpid()}.tmp'
+	try:
+		shutil.copyfile(movie_file, temporary_path)
+		os.replace(temporary_path, path)
+	except OSError as error:
+		logger.warning(f'Could not store the clip {path}: {error}')
+		if os.path.exists(temporary_path):
+			os.remove(temporary_path)
@@ -0,0 +1,91 @@
+from collections import namedtuple
+
+import numpy as np
+from manim import ORIGIN, TAU
+
+# distance between neighbouring dots when circle radii follow the cycle lengths; that of 20 dots on a radius 3 circle
+DOT_SPACING = 3 * TAU / 20
+MIN_RADIUS = 0.5
+# the share of the frame the circles may cover in either direction, so that they never touch
+PACKING = 0.9
+
+# centers is an m x 3 array and radii has length m; gap_centers maps a cycle's index to the middle of its gap
+CycleLayout = namedtuple('CycleLayout', ['centers', 'radii', 'gap_centers'])
+
+
+def ring_points(center, radius, count):
+	# count points evenly around a circle, the first one at angle 0, as circle.point_at_angle would place them
+	angles = np.arange(count) * TAU / count
+	points = np.zeros((count, 3))
+	points[:, 0] = np.cos(angles)
+	points[:, 1] = np.sin(angles)
+	return np.asarray(center) + radius * points
+
+
+def split_rows(widths, num_rows):
+	# contiguous runs of cycles with roughly equal total width
+	total = widths.sum()
+	bounds = [0]
+	elapsed = 0
+	for index, width in enumerate(widths[:-1]):
+		elapsed += width
+		if len(bounds) < num_rows and elapsed >= total * len(bounds) / num_rows:
+			bounds.append(index + 1)
+	bounds.append(len(widths))
+	return [np.arange(start, end) for start, end in zip(bounds, bounds[1:])]
+
+
+def pack_cycles(lengths, width, height, center=ORIGIN, radius=None, dot_spacing=DOT_SPACING, gaps=None):
+	# Places one circle per cycle in a width x height frame, in rows that keep the cycles in order. Each row
+	# spreads its spare width evenly before, between and after its circles, except that gaps maps a cycle's
+	# index to a fixed amount of space after it. With radius every circle gets that radius, otherwise radii
+	# follow the cycle lengths so that neighbouring dots are dot_spacing apart. Everything shrinks together
+	# when even the best number of rows does not fit.
+	lengths = np.asarray(lengths)
+	if len(lengths) == 0:
+		return CycleLayout(np.zeros((0, 3)), np.zeros(0), {})
+	if radius is None:
+		radii = np.maximum(lengths * dot_spacing / TAU, MIN_RADIUS)
+	else:
+		radii = np.full(len(lengths), float(radius))
+	gap_widths = np.zeros(len(lengths))
+	for index, gap in (gaps or {}).items():
+		gap_widths[index] = gap
+	widths = 2 * radii + gap_widths
+
+	best_scale, best_rows = 0, None
+	for num_rows in range(1, len(lengths) + 1):
+		rows = split_rows(widths, num_rows)
+		scale = min(
+			1,
+			PACKING * width / max(widths[row].sum() for row in rows),
+			PACKING * height / sum(2 * radii[row].max() for row in rows)
+		)
+		if scale > best_scale:
+			best_scale, best_rows = scale, rows
+		# the fewest rows that fit without shrinking
+		if scale == 1:
+			break
+	radii = radii * best_scale
+	gap_widths = gap_widths * best_scale
+
+	row_heights = np.array([2 * radii[row].max() for row in best_rows])
+	row_spacing = (height - row_heights.sum()) / (len(best_rows) + 1)
+	row_tops = center[1] + height / 2 - row_spacing * np.arange(1, len(best_rows) + 1)
+	row_tops -= np.concatenate([[0], np.cumsum(row_heights)[:-1]])
+
+	centers = np.zeros((len(lengths), 3))
+	centers[:, 2] = center[2]
+	gap_centers = {}
+	for row, top, row_height in zip(best_rows, row_tops, row_heights):
+		fixed = gap_widths[row] > 0
+		spacing = (width - 2 * radii[row].sum() - gap_widths[row].sum()) / (1 + np.count_nonzero(~fixed))
+		# every circle is followed by either its gap or the even spacing
+		after = np.where(fixed, gap_widths[row], spacing)
+		lefts = center[0] - width / 2 + spacing + np.concatenate([[0], np.cumsum(2 * radii[row] + after)[:-1]])
+		centers[row, 0] = lefts + radii[row]
+		centers[row, 1] = top - row_height / 2
+		for index, right, gap in zip(row, lefts + 2 * radii[row], gap_widths[row]):
+			if gap > 0:
+				gap_centers[int(index)] = np.array([right + gap / 2, top - row_height / 2, center[2]])
+	return CycleLayout(centers, radii, gap_centers)
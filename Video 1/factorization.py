@@ -0,0 +1,42 @@
+from functools import lru_cache
+
+import numpy as np
+from sympy.ntheory import factorint
+
+FACTORIZATION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=FACTORIZATION_CACHE_SIZE)
+def _cached_factorint(num):
+	# stored as a tuple so that callers can never mutate a cached entry
+	return tuple(sorted(factorint(num).items()))
+
+
+def factorize(num):
+	return dict(_cached_factorint(num))
+
+
+def factorize_many(int_array):
+	return [factorize(num) for num in int_array]
+
+
+def exponent_matrix(int_array):
+	# rows are the sorted primes dividing any input, columns are the inputs
+	factorizations = factorize_many(int_array)
+	primes = sorted({prime for factorization in factorizations for prime in factorization})
+	prime_rows = {prime: row for row, prime in enumerate(primes)}
+
+	exponents = np.zeros((len(primes), len(int_array)), dtype=np.int64)
+	for column, factorization in enumerate(factorizations):
+		for prime, exponent in factorization.items():
+			exponents[prime_rows[prime], column] = exponent
+
+	return primes, exponents
+
+
+def factorization_cache_info():
+	return _cached_factorint.cache_info()
+
+
+def clear_factorization_cache():
+	_cached_factorint.cache_clear()
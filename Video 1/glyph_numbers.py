@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+
+import manim.mobject.numbers as numbers
+import numpy as np
+from manim import DecimalNumber, SingleStringMathTex
+
+from tex_cache import tex_geometry_cache
+
+
+def glyph(char, **kwargs):
+	# every digit, sign, comma and point is typeset once and then copied out of the tex geometry cache
+	return tex_geometry_cache.get(SingleStringMathTex, char, **kwargs)
+
+
+@contextmanager
+def cached_glyphs():
+	# DecimalNumber typesets each character through the SingleStringMathTex of its own module, so within this block
+	# that name hands out cached glyphs instead
+	previous = numbers.SingleStringMathTex
+	numbers.SingleStringMathTex = glyph
+	try:
+		yield
+	finally:
+		numbers.SingleStringMathTex = previous
+
+
+class GlyphDecimalNumber(DecimalNumber):
+	# A DecimalNumber whose characters come from the glyph cache, so changing the value never runs LaTeX or parses
+	# an SVG again.
+	def __init__(self, number=0, **kwargs):
+		with cached_glyphs():
+			super().__init__(number, **kwargs)
+
+	def set_value(self, number, **config):
+		with cached_glyphs():
+			return super().set_value(number, **config)
+
+
+class GlyphInteger(GlyphDecimalNumber):
+	def __init__(self, number=0, num_decimal_places=0, **kwargs):
+		super().__init__(number, num_decimal_places=num_decimal_places, **kwargs)
+
+	def get_value(self):
+		return int(np.round(super().get_value()))
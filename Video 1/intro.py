@@ -0,0 +1,15 @@
+from manim import *
+
+import logo
+
+
+class Logo(logo.Logo):
+	# the intro shared with logo.py, followed by the logo leaving the screen. It lives apart from proof.py so that the
+	# clip cached for it only changes with the logo itself.
+	def construct(self):
+		super().construct()
+		self.wait()
+		self.play(
+			FadeOut(self.circles)
+		)
+		self.play(FadeOut(self.integrals), FadeOut(self.channel_name))
@@ -1,16 +1,20 @@
 import math
+from bisect import bisect_left
 
 from manim import *
-from sympy.ntheory import factorint
+
+from animations import MoveCenters, submobject_centers
+from factorization import exponent_matrix, factorize
+from rendering import HeldFrameScene
+from tex_cache import cached_math_tex
 
 
 def prime_factorization_in_tex(num_to_be_factored):
 	tex_strs = []
-	for prime in factorint(num_to_be_factored):
-		exponent = factorint(num_to_be_factored)[prime]
+	for prime, exponent in factorize(num_to_be_factored).items():
 		tex_strs.append(str(prime))
 		if exponent > 1:
-			tex_strs.append('^{' + str(factorint(num_to_be_factored)[prime]) + '}')
+			tex_strs.append('^{' + str(exponent) + '}')
 		tex_strs.append(r'\cdot ')
 
 	if tex_strs[len(tex_strs) - 1] == r'\cdot ':
@@ -21,9 +25,9 @@ def prime_factorization_in_tex(num_to_be_factored):
 
 def prime_factorization_in_tex_wexp_1(num_to_be_factored):
 	tex_strs = []
-	for prime in factorint(num_to_be_factored):
+	for prime, exponent in factorize(num_to_be_factored).items():
 		tex_strs.append(str(prime))
-		tex_strs.append('^{' + str(factorint(num_to_be_factored)[prime]) + '}')
+		tex_strs.append('^{' + str(exponent) + '}')
 		tex_strs.append(r'\cdot ')
 
 	if tex_strs[len(tex_strs) - 1] == r'\cdot ':
@@ -65,23 +69,12 @@ def factorize_array_1(int_array):
 def factorize_with_exp_0(int_array):
 	tex_strs = []
 
-	all_primes_with_duplicates = [prime for thingy in int_array for prime in factorint(thingy)]
-
-	all_primes = []
-
-	for x in all_primes_with_duplicates:
-		if x not in all_primes:
-			all_primes.append(x)
-
-	all_primes.sort()
+	all_primes, exponents = exponent_matrix(int_array)
 
 	for index in range(len(int_array)):
 		tex_strs.append(str(int_array[index]))
 		tex_strs.append('&=')
-		for prime in all_primes:
-			exponent = 0
-			if prime in factorint(int_array[index]).keys():
-				exponent = factorint(int_array[index])[prime]
+		for prime, exponent in zip(all_primes, exponents[:, index]):
 			tex_strs.append(str(prime))
 
 			if exponent != 1:
@@ -99,37 +92,16 @@ def factorize_with_exp_0(int_array):
 def factorize_with_boxed(int_array):
 	tex_strs = []
 
-	all_primes_with_duplicates = []
-	for index in range(len(int_array)):
-		for prime in factorint(int_array[index]):
-			all_primes_with_duplicates.append(prime)
-
-	all_primes = []
-	for x in all_primes_with_duplicates:
-		if x not in all_primes:
-			all_primes.append(x)
-	all_primes.sort()
-
-	max_exponent_of_prime = []
-	for prime in all_primes:
-		max_exp = 0
-		max_exp_index = 0
-		if prime in factorint(int_array[0]):
-			max_exp = factorint(int_array[0])[prime]
-
-		for index in range(len(int_array)):
-			if prime in factorint(int_array[index]) and factorint(int_array[index])[prime] > max_exp:
-				max_exp = factorint(int_array[index])[prime]
-				max_exp_index = index
-		max_exponent_of_prime.append(max_exp_index)
+	all_primes, exponents = exponent_matrix(int_array)
+
+	# argmax picks the first input holding the largest exponent of each prime
+	max_exponent_of_prime = exponents.argmax(axis=1)
 
 	for index in range(len(int_array)):
 		tex_strs.append(str(int_array[index]))
 		tex_strs.append('&=')
 		for prime_index in range(len(all_primes)):
-			exponent = 0
-			if all_primes[prime_index] in factorint(int_array[index]).keys():
-				exponent = factorint(int_array[index])[all_primes[prime_index]]
+			exponent = exponents[prime_index, index]
 			tex_strs.append(str(all_primes[prime_index]))
 
 			if index == max_exponent_of_prime[prime_index]:
@@ -145,19 +117,75 @@ def factorize_with_boxed(int_array):
 	return tex_strs
 
 
-def locations_of_lcm_inputs(general_array):
-	input_index_array = [0]
-	while '&=' in general_array[input_index_array[-1] + 1: len(general_array) - 1: 1]:
-		input_index_array.append(general_array.index('&=', input_index_array[-1] + 1, len(general_array) - 1))
-	input_index_array.pop(0)
+class TokenIndex:
+	def __init__(self, tex_strs):
+		self.positions = {}
+		for position, token in enumerate(tex_strs):
+			self.positions.setdefault(token, []).append(position)
+
+	def __contains__(self, token):
+		return token in self.positions
+
+	def positions_of(self, token, start=0, stop=None):
+		positions = self.positions.get(token, [])
+		if stop is None:
+			return positions[bisect_left(positions, start):]
+		return positions[bisect_left(positions, start):bisect_left(positions, stop)]
+
+	def find(self, token, start=0):
+		# first position >= start holding token, or None if there is none
+		positions = self.positions.get(token, [])
+		next_position = bisect_left(positions, start)
+		if next_position == len(positions):
+			return None
+		return positions[next_position]
+
+	def index(self, token, start=0):
+		position = self.find(token, start)
+		if position is None:
+			raise ValueError(f'{token!r} does not occur at or after position {start}')
+		return position
+
 
-	for index in range(len(input_index_array)):
-		input_index_array[index] += -1
+def uncolor_exponent(token):
+	colored_prefix = r'^{\color{red}'
+	if token.startswith(colored_prefix):
+		return '^{' + token[len(colored_prefix):]
+	return token
 
-	return input_index_array
 
+def align_tokens(source_strs, target_strs, equivalences=()):
+	# matches every source token, in order, to the first equivalent target token at or after the previous match
+	def canonical(token):
+		for equivalence in equivalences:
+			token = equivalence(token)
+		return token
 
-class LCMExplanation(Scene):
+	target_index = TokenIndex([canonical(token) for token in target_strs])
+
+	alignment = []
+	previous_index = 0
+	for source_index, token in enumerate(source_strs):
+		previous_index = target_index.index(canonical(token), previous_index)
+		alignment.append((source_index, previous_index))
+
+	return alignment
+
+
+def aligned_moves(source, source_strs, target, target_strs, equivalences=()):
+	# one animation for the whole expression, taking every source token to the center of its matching target token
+	centers = submobject_centers(source)
+	for source_index, target_index in align_tokens(source_strs, target_strs, equivalences):
+		centers[source_index] = target[target_index].get_center()
+	return MoveCenters(source, centers)
+
+
+def locations_of_lcm_inputs(general_array):
+	token_index = TokenIndex(general_array)
+	return [position - 1 for position in token_index.positions_of('&=', 1, len(general_array) - 1)]
+
+
+class LCMExplanation(HeldFrameScene):
 
 	def construct(self):
 		lcm_inputs = [455, 500, 340, 117]
@@ -166,19 +194,19 @@ class LCMExplanation(Scene):
 			lcm = lcm * num // math.gcd(lcm, num)
 
 		lcm_expression_starr = [r'\text{lcm}(', '455', ',', '500', ',', '340', ',', '117', ')']
-		lcm_expression = MathTex(*lcm_expression_starr)
+		lcm_expression = cached_math_tex(*lcm_expression_starr)
 
 		factored_inputs_starr = factorize_array(lcm_inputs)
-		factored_inputs = MathTex(*factored_inputs_starr)
+		factored_inputs = cached_math_tex(*factored_inputs_starr)
 
 		factored_exp_1_starr = factorize_array_1(lcm_inputs)
-		factored_exp_1 = MathTex(*factored_exp_1_starr)
+		factored_exp_1 = cached_math_tex(*factored_exp_1_starr)
 
 		factored_exp_0_starr = factorize_with_exp_0(lcm_inputs)
-		factored_exp_0 = MathTex(*factored_exp_0_starr)
+		factored_exp_0 = cached_math_tex(*factored_exp_0_starr)
 
 		factored_colored_exp_starr = factorize_with_boxed(lcm_inputs)
-		factored_colored_exp = MathTex(*factored_colored_exp_starr).shift(RIGHT)
+		factored_colored_exp = cached_math_tex(*factored_colored_exp_starr).shift(RIGHT)
 
 		indices_of_factored_lcm_inputs = locations_of_lcm_inputs(factored_inputs_starr)
 		indices_of_lcm_inputs_colored_exp = locations_of_lcm_inputs(factored_colored_exp_starr)
@@ -199,63 +227,30 @@ class LCMExplanation(Scene):
 			for index in range(len(lcm_inputs))
 		]
 
-		moves_to_final_locations_1 = []
-		moves_to_final_locations_2 = []
-		alt_moves_to_final_locations_1 = []
-
-		previous_index_1 = 0
-		alt_prev_index = 0
-		for index in range(len(factored_inputs)):
-			next_index = factored_exp_0_starr.index(
-				factored_inputs_starr[index], previous_index_1,
-				len(factored_exp_0_starr)
-			)
-			move = factored_inputs[index].animate.move_to(factored_exp_0[next_index].get_center())
-			previous_index_1 = next_index
-			moves_to_final_locations_1.append(move)
-
-		for index in range(len(factored_inputs)):
-			next_index = factored_exp_1_starr.index(
-				factored_inputs_starr[index], alt_prev_index,
-				len(factored_exp_1_starr)
-			)
-			move = factored_inputs[index].animate.move_to(factored_exp_1[next_index].get_center())
-			alt_prev_index = next_index
-			alt_moves_to_final_locations_1.append(move)
-
-		previous_index_2 = 0
-		for index in range(len(factored_exp_1)):
-			color_string = r'^{\color{red}' + factored_exp_1_starr[index][2: -1: 1] + '}'
-			next_index_cand_1 = len(factored_colored_exp_starr) + 1
-			next_index_cand_2 = len(factored_colored_exp_starr) + 1
-			if color_string in factored_colored_exp_starr[previous_index_2: len(factored_colored_exp_starr)]:
-				next_index_cand_1 = factored_colored_exp_starr.index(
-					color_string, previous_index_2,
-					len(factored_colored_exp_starr)
-				)
-			if factored_exp_1_starr[index] in factored_colored_exp_starr[previous_index_2: len(factored_colored_exp_starr)]:
-				next_index_cand_2 = factored_colored_exp_starr.index(
-					factored_exp_1_starr[index], previous_index_2,
-					len(factored_colored_exp_starr)
-				)
-			next_index_2 = min(next_index_cand_1, next_index_cand_2)
-			move = factored_exp_1[index].animate.move_to(factored_colored_exp[next_index_2].get_center())
-			previous_index_2 = next_index_2
-			moves_to_final_locations_2.append(move)
+		moves_to_final_locations_1 = aligned_moves(
+			factored_inputs, factored_inputs_starr, factored_exp_0, factored_exp_0_starr
+		)
+		alt_moves_to_final_locations_1 = aligned_moves(
+			factored_inputs, factored_inputs_starr, factored_exp_1, factored_exp_1_starr
+		)
+		moves_to_final_locations_2 = aligned_moves(
+			factored_exp_1, factored_exp_1_starr, factored_colored_exp, factored_colored_exp_starr,
+			equivalences=[uncolor_exponent]
+		)
 
 		lcm_expression_starr.append('=')
 
 		for string in factorize_with_boxed([lcm])[2: -1]:
 			lcm_expression_starr.append(string)
 
-		lcm_expression_final = MathTex(*lcm_expression_starr)
+		lcm_expression_final = cached_math_tex(*lcm_expression_starr)
 		lcm_expression_final.shift(
 			lcm_expression[0].get_center() - lcm_expression_final[0].get_center() + lcm_expression_final_location
 		)
 		lcm_expression_final.set_color_by_tex(r'\color{red}', RED)
 
 		# expression = MathTex(r"455 \text{ } 500 \text{ } 340 \text{ } 117")
-		expression = MathTex(
+		expression = cached_math_tex(
 			r'\text{lcm}(', '455', ',', '500', ',', '340', ',', '117', ')'
 		)
 
@@ -270,11 +265,11 @@ class LCMExplanation(Scene):
 		self.play(FadeIn(factored_inputs))
 		self.remove(*input_copies)
 		self.wait(6.5)
-		self.play(*alt_moves_to_final_locations_1)
+		self.play(alt_moves_to_final_locations_1)
 		self.play(FadeIn(factored_exp_1))
 		self.remove(factored_inputs)
 		self.wait(4)
-		self.play(*moves_to_final_locations_2)
+		self.play(moves_to_final_locations_2)
 		self.wait(1.5)
 		self.play(FadeIn(factored_colored_exp))
 		self.wait(6)
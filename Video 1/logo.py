@@ -1,12 +1,16 @@
 from manim import *
 
+from animations import FadeOpacity
+from rendering import HeldFrameScene
+from tex_cache import cached_math_tex
 
-class Logo(Scene):
+
+class Logo(HeldFrameScene):
 	def construct(self):
 		num_integrals = 5
 
 		rate_func = rate_functions.ease_in_out_cubic
-		channel_name = MathTex(*[r'\text{The Geometers}']).shift(2.6 * DOWN)
+		channel_name = cached_math_tex(*[r'\text{The Geometers}']).shift(2.6 * DOWN)
 		initial_circ = Circle(radius=0.037, fill_color=BLUE, fill_opacity=1, stroke_color=BLUE, stroke_width=4)
 
 		circ_list = [initial_circ]
@@ -21,26 +25,22 @@ class Logo(Scene):
 			)
 		circles = VGroup(initial_circ, *circ_list)
 
-		integral_list = [MathTex(r'\int').rotate(PI * index / num_integrals).scale(3) for index in range(num_integrals)]
-		integrals = VGroup(*integral_list)
+		integral_list = [cached_math_tex(r'\int').rotate(PI * index / num_integrals).scale(3) for index in range(num_integrals)]
+		# the first integral is written, the others fade in one after another
+		later_integrals = VGroup(*integral_list[1:])
+		integrals = VGroup(integral_list[0], later_integrals)
 
 		delay = 0.75
 		hacking_delay = Rotate(Square(1).set_opacity(0), run_time=delay)
-		integral_fade_ins = [hacking_delay]
-
-		def update_sector(mob, alpha):
-			mob.become(mob.set_opacity(interpolate(0, 1, alpha)))
 
 		run_time = 2
-		for integral in integrals[1:]:
-			integral_fade_ins.append(
-				UpdateFromAlphaFunc(
-					integral, update_sector, rate_func=rate_func, run_time=run_time - 2 * delay / (num_integrals - 1)
-				)
-			)
-
-		integral_fade_ins.append(hacking_delay)
-		fade_in_group = AnimationGroup(*integral_fade_ins, lag_ratio=1)
+		integral_fade_ins = FadeOpacity(
+			later_integrals,
+			lag_ratio=1,
+			rate_func=rate_func,
+			run_time=(num_integrals - 1) * (run_time - 2 * delay / (num_integrals - 1))
+		)
+		fade_in_group = AnimationGroup(hacking_delay, integral_fade_ins, hacking_delay, lag_ratio=1)
 
 		self.play(Write(integrals[0]), run_time=run_time)
 		self.play(
@@ -50,4 +50,5 @@ class Logo(Scene):
 			FadeIn(circles, run_time=4 * run_time),
 			Write(channel_name, run_time=4 * run_time)
 		)
+		self.circles, self.integrals, self.channel_name = circles, integrals, channel_name
 
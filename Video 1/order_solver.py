@@ -0,0 +1,43 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from factorization import factorize
+
+SOLUTION_CACHE_SIZE = 1024
+
+# cycle_type is in ascending order; prime_powers are (prime, exponent) pairs in ascending order of prime
+OrderSolution = namedtuple('OrderSolution', ['order', 'degree', 'cycle_type', 'prime_powers'])
+
+
+@lru_cache(maxsize=SOLUTION_CACHE_SIZE)
+def least_degree_with_order(order):
+	# the least n for which some permutation of n objects has the given order
+	if order < 1:
+		raise ValueError(f'The order of a permutation must be a positive integer, not {order}')
+
+	prime_powers = tuple(sorted(factorize(order).items()))
+
+	# only the identity has order 1, and it needs at least one object to act on
+	if not prime_powers:
+		return OrderSolution(order, 1, (1,), ())
+
+	# every p^a in the factorization has to divide the length of some cycle. Giving each its own cycle is
+	# optimal because two coprime parts x, y > 1 always satisfy x * y > x + y, so sharing a cycle only costs
+	# more. The same inequality rules out ties: the optimal cycle type is unique, and a prime power order
+	# is a single cycle of that length.
+	cycle_type = tuple(sorted(prime ** exponent for prime, exponent in prime_powers))
+	return OrderSolution(order, sum(cycle_type), cycle_type, prime_powers)
+
+
+def solver_cache_info():
+	return least_degree_with_order.cache_info()
+
+
+def clear_solver_cache():
+	least_degree_with_order.cache_clear()
+
+
+def prime_power_tex(prime, exponent):
+	if exponent == 1:
+		return str(prime)
+	return f'{prime}^{{{exponent}}}' if exponent >= 10 else f'{prime}^{exponent}'
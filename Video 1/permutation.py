@@ -0,0 +1,112 @@
+import math
+from functools import reduce
+
+import numpy as np
+
+
+class Permutation:
+	# images[i] is f(i); elements are 0-indexed
+	def __init__(self, images):
+		self.images = np.asarray(images, dtype=np.intp)
+		if not np.array_equal(np.sort(self.images), np.arange(len(self.images))):
+			raise ValueError(f'{list(images)} is not a permutation of 0..{len(self.images) - 1}')
+
+	@classmethod
+	def identity(cls, size):
+		return cls(np.arange(size))
+
+	@classmethod
+	def from_mapping(cls, mapping, size=None):
+		if size is None:
+			size = max(mapping) + 1
+		images = np.arange(size)
+		images[list(mapping.keys())] = list(mapping.values())
+		return cls(images)
+
+	@classmethod
+	def from_cycles(cls, cycles, size):
+		images = np.arange(size)
+		for cycle in cycles:
+			cycle = np.asarray(cycle, dtype=np.intp)
+			images[cycle] = np.roll(cycle, -1)
+		return cls(images)
+
+	def __len__(self):
+		return len(self.images)
+
+	def __call__(self, element):
+		return int(self.images[element])
+
+	def __eq__(self, other):
+		return isinstance(other, Permutation) and np.array_equal(self.images, other.images)
+
+	def __repr__(self):
+		return f'Permutation({self.images.tolist()})'
+
+	def cycle_containing(self, start):
+		cycle = [start]
+		element = self(start)
+		while element != start:
+			cycle.append(element)
+			element = self(element)
+		return cycle
+
+	def cycles(self, include_fixed_points=False):
+		visited = np.zeros(len(self), dtype=bool)
+		cycles = []
+		for start in range(len(self)):
+			if visited[start]:
+				continue
+			cycle = self.cycle_containing(start)
+			visited[cycle] = True
+			if len(cycle) > 1 or include_fixed_points:
+				cycles.append(cycle)
+		return cycles
+
+	def cycle_type(self):
+		return sorted(len(cycle) for cycle in self.cycles(include_fixed_points=True))
+
+	def order(self):
+		return reduce(lambda lcm, length: lcm * length // math.gcd(lcm, length), self.cycle_type(), 1)
+
+	def moves(self):
+		# (element, image) for every element that is not fixed
+		return [(int(element), self(element)) for element in np.flatnonzero(self.images != np.arange(len(self)))]
+
+	def inverse(self):
+		images = np.empty_like(self.images)
+		images[self.images] = np.arange(len(self))
+		return Permutation(images)
+
+	def compose(self, other):
+		# (self o other)(i) = self(other(i))
+		return Permutation(self.images[other.images])
+
+	def power(self, exponent):
+		# each cycle is rotated by exponent places, so this is O(n) for any exponent
+		images = np.empty_like(self.images)
+		for cycle in self.cycles(include_fixed_points=True):
+			cycle = np.asarray(cycle, dtype=np.intp)
+			images[cycle] = np.roll(cycle, -(exponent % len(cycle)))
+		return Permutation(images)
+
+
+class SlotTracker:
+	# item i starts in slot i; slot_of[item] and occupant[slot] are kept as inverse arrays
+	def __init__(self, size):
+		self.slot_of = np.arange(size)
+		self.occupant = np.arange(size)
+
+	def __len__(self):
+		return len(self.slot_of)
+
+	def slot(self, item):
+		return int(self.slot_of[item])
+
+	def item_in(self, slot):
+		return int(self.occupant[slot])
+
+	def advance(self, permutation):
+		# whatever sits in slot s moves to slot permutation(s)
+		self.slot_of = permutation.images[self.slot_of]
+		self.occupant[self.slot_of] = np.arange(len(self))
@@ -0,0 +1,94 @@
+import numpy as np
+from manim import ORIGIN, PI, TAU, WHITE, Animation, Mobject, PMobject, color_to_rgb, config, interpolate
+
+from cycle_layout import ring_points
+
+# the side of each drawn point, in scene units at the default camera frame
+POINT_SIZE = 0.06
+
+
+class PointRing(PMobject):
+	# n points evenly around a circle, kept as one n x 3 array of positions and one n x 4 array of colors, so the
+	# camera draws the whole ring in a single pass however large n is. Point i stays point i through every
+	# permutation; only its position changes. colors and opacities hold each point's own style, while rgbas is
+	# what gets drawn: the camera copies point colors straight into the frame, so opacity is mixed into the
+	# background color beforehand.
+	def __init__(self, num_points, radius=3, center=ORIGIN, color=WHITE, point_size=POINT_SIZE, **kwargs):
+		super().__init__(stroke_width=point_size * config['pixel_height'] / config['frame_height'], **kwargs)
+		self.colors = np.repeat([color_to_rgb(color)], num_points, axis=0)
+		self.opacities = np.ones(num_points)
+		self.add_points(ring_points(center, radius, num_points), rgbas=np.ones((num_points, 4)))
+		self.update_rgbas()
+
+	def get_ring_center(self):
+		# evenly spaced points average out to the center, wherever the ring has been moved or scaled to
+		return self.points.mean(axis=0)
+
+	def get_positions(self, indices=slice(None)):
+		return self.points[indices]
+
+	def update_rgbas(self):
+		background = color_to_rgb(config['background_color'])
+		self.rgbas[:, :3] = interpolate(background, self.colors, self.opacities[:, None])
+		self.rgbas[:, 3] = 1
+		return self
+
+	def set_style_at(self, indices, color=None, opacity=None):
+		# indices is anything that indexes a NumPy array: an index, a list, a slice or a boolean mask
+		if color is not None:
+			self.colors[indices] = color_to_rgb(color)
+		if opacity is not None:
+			self.opacities[indices] = opacity
+		return self.update_rgbas()
+
+	def set_color(self, color=WHITE, family=True):
+		self.color = color
+		return self.set_style_at(slice(None), color=color)
+
+	def apply_permutation(self, permutation):
+		# moves point i to where point permutation(i) is, at once
+		images = np.asarray(getattr(permutation, 'images', permutation), dtype=np.intp)
+		self.points = self.points[images]
+		return self
+
+
+class PermutePoints(Animation):
+	# Moves every point i of a PointRing to where point permutation(i) is, with one array operation per frame
+	# for all n points. With along_ring the points travel around the ring the short way instead of across it.
+	def __init__(self, ring, permutation, along_ring=True, **kwargs):
+		self.images = np.asarray(getattr(permutation, 'images', permutation), dtype=np.intp)
+		self.along_ring = along_ring
+		super().__init__(ring, **kwargs)
+
+	def create_starting_mobject(self):
+		return Mobject()
+
+	def get_all_mobjects(self):
+		return [self.mobject]
+
+	def begin(self):
+		self.start_points = self.mobject.points.copy()
+		self.end_points = self.start_points[self.images]
+
+		self.ring_center = self.mobject.get_ring_center()
+		start = self.start_points - self.ring_center
+		end = self.end_points - self.ring_center
+		self.start_angles = np.arctan2(start[:, 1], start[:, 0])
+		turns = np.arctan2(end[:, 1], end[:, 0]) - self.start_angles
+		self.turns = (turns + PI) % TAU - PI
+		self.start_radii = np.hypot(start[:, 0], start[:, 1])
+		self.end_radii = np.hypot(end[:, 0], end[:, 1])
+		super().begin()
+
+	def interpolate_mobject(self, alpha):
+		alpha = self.rate_func(alpha)
+		points = self.mobject.points
+		if not self.along_ring:
+			points[:] = interpolate(self.start_points, self.end_points, alpha)
+			return
+
+		angles = self.start_angles + alpha * self.turns
+		radii = interpolate(self.start_radii, self.end_radii, alpha)
+		points[:, 0] = self.ring_center[0] + radii * np.cos(angles)
+		points[:, 1] = self.ring_center[1] + radii * np.sin(angles)
+		points[:, 2] = interpolate(self.start_points[:, 2], self.end_points[:, 2], alpha)
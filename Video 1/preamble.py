@@ -1,7 +1,12 @@
 from abc import ABC
 
 from manim import *
-from numpy.linalg import linalg
+
+from animations import RadialScale
+from arrows import ArrowField, arrow_add_sticky_updater
+from glyph_numbers import GlyphInteger
+from rendering import HeldFrameScene
+from tex_cache import cached_math_tex
 
 
 class CustomArrowTip(ArrowTip, Triangle, ABC):
@@ -23,15 +28,6 @@ def make_arrow_between(dot1, dot2, buff):
 	return arrow
 
 
-def arrow_add_sticky_updater(arrow, dot1, dot2):
-	arrow.add_updater(
-		lambda arw: arw.put_start_and_end_on(
-			Line(start=dot1.get_center(), end=dot2.get_center()).scale(0.9).get_start(),
-			Line(start=dot1.get_center(), end=dot2.get_center()).scale(0.9).get_end()
-		)
-	)
-
-
 def make_sticky_arrow_between(dot1, dot2):
 	arrow = make_arrow_between(dot1, dot2)
 	arrow_add_sticky_updater(arrow, dot1, dot2)
@@ -40,22 +36,15 @@ def make_sticky_arrow_between(dot1, dot2):
 
 
 def scale_from_point(group, point, factor):
-	moves = []
-	for obj in group:
-		dist = linalg.norm(obj.get_center() - point.get_center())
-		if dist != 0:
-			direction = (obj.get_center() - point.get_center()) / dist
-			moves.append(obj.animate.move_to(point.get_center() + direction * dist * factor))
-
-	return moves
+	return RadialScale(group, point, factor)
 
 
-class Preamble(Scene):
+class Preamble(HeldFrameScene):
 	def construct(self):
 		num_dots = 5
 		spacing = 1
 		ddots = [Dot(LEFT * (num_dots - 1) / 2 * spacing + spacing * ind * RIGHT) for ind in range(num_dots)]
-		labels = [Integer(num + 1).scale(0.5).next_to(dot, DOWN) for num, dot in enumerate(ddots)]
+		labels = [GlyphInteger(num + 1).scale(0.5).next_to(dot, DOWN) for num, dot in enumerate(ddots)]
 		for dot, label in zip(ddots, labels):
 			label.add_updater(lambda l, dot=dot, label=label: l.next_to(dot, DOWN))
 
@@ -70,7 +59,7 @@ class Preamble(Scene):
 			new_dot = Dot(loc)
 			copy = labels[curre[0]].next_to(ddots[curre[0]], DOWN)
 			self.remove(labels[curre[0]])
-			lab = Integer(curre[0] + 1).scale(0.5).next_to(new_dot, DOWN)
+			lab = GlyphInteger(curre[0] + 1).scale(0.5).next_to(new_dot, DOWN)
 			for index in range(num_dots):
 				if index == curre[0]:
 					g1 = AnimationGroup(FadeOut(copy), FadeOut(ddots[curre[0]]), run_time=run_time / 2)
@@ -107,7 +96,7 @@ class Preamble(Scene):
 		#
 		# self.play(*moves, FadeOut(*labels), run_time=0.5)
 		# grp = VGroup(*dots)
-		# self.play(*scale_from_point(grp, dots[-1], 1.5), run_time=0.5)
+		# self.play(scale_from_point(grp, dots[-1], 1.5), run_time=0.5)
 
 		moves = [
 			dots_copy[-1].animate.move_to(dots[3].get_center() + shift_vec),
@@ -116,9 +105,9 @@ class Preamble(Scene):
 			dots_copy[1].animate.shift(RIGHT * 1.1 + UP * 1.1 + shift_vec),
 			dots_copy[0].animate.shift(RIGHT * 2.1 + DOWN * 1.1 + shift_vec)
 		]
-		self.play(*moves, run_time=0.001)
+		self.stage(*moves)
 		grp = VGroup(*dots_copy)
-		self.play(*scale_from_point(grp, dots_copy[-1], 1.5), run_time=0.001)
+		self.stage(scale_from_point(grp, dots_copy[-1], 1.5))
 
 		self.play(
 			*[Transform(dot, copy.copy().set_opacity(1)) for dot, copy in zip(dots, dots_copy)],
@@ -137,11 +126,11 @@ class Preamble(Scene):
 		bond5 = make_arrow_between(dots[1], dots[3], buff=buff1)
 		bond6 = make_arrow_between(dots[0], dots[2], buff=buff1)
 
-		c4 = MathTex('C').scale(0.5).move_to(dots[4].get_center())
-		c3 = MathTex('C').scale(0.5).move_to(dots[3].get_center())
-		c2 = MathTex('C').scale(0.5).move_to(dots[2].get_center())
-		c1 = MathTex('H').scale(0.5).move_to(dots[1].get_center())
-		c0 = MathTex('H').scale(0.5).move_to(dots[0].get_center())
+		c4 = cached_math_tex('C').scale(0.5).move_to(dots[4].get_center())
+		c3 = cached_math_tex('C').scale(0.5).move_to(dots[3].get_center())
+		c2 = cached_math_tex('C').scale(0.5).move_to(dots[2].get_center())
+		c1 = cached_math_tex('H').scale(0.5).move_to(dots[1].get_center())
+		c0 = cached_math_tex('H').scale(0.5).move_to(dots[0].get_center())
 
 		electron1 = Dot().scale(0.3).move_to(dots[4].get_center() + 0.1 * (RIGHT + UP) + RIGHT * 0.05)
 		electron2 = Dot().scale(0.3).move_to(dots[4].get_center() + 0.1 * (RIGHT + DOWN) + RIGHT * 0.05)
@@ -180,10 +169,8 @@ class Preamble(Scene):
 			run_time=0.75
 		)
 
-		arrow_add_sticky_updater(bond5, dots[1], dots[3])
-		arrow_add_sticky_updater(bond6, dots[0], dots[2])
-
-		arrow_add_sticky_updater(bond1, dots[4], dots[3])
+		bonds = ArrowField([bond5, bond6, bond1], dots, [(1, 3), (0, 2), (4, 3)]).make_sticky()
+		self.add(bonds)
 
 		self.play(
 			dots[0].animate.move_to(dots[4].get_center() + 1.5 * LEFT),
@@ -206,38 +193,38 @@ class Preamble(Scene):
 		self.play(Rotate(poly, np.round(TAU / 5, 13)))
 		self.play(Rotate(poly, axis=UP))
 
-		abstract = MathTex('\\text{Aut}(C_p^n)=\{f: C_p^n\\to C_p^n\mid f\\text{ is an isomorphism}\}')
+		abstract = cached_math_tex('\\text{Aut}(C_p^n)=\{f: C_p^n\\to C_p^n\mid f\\text{ is an isomorphism}\}')
 
 		self.play(Transform(poly, abstract), run_time=1)
 		self.wait(2)
 		self.play(FadeOut(poly))
 
-		uses = MathTex(
+		uses = cached_math_tex(
 			r"&1. \text{ Diffie-Hellman Key Exchange (Cryptography)}\\"
 			r"&2. \text{ Noether's Theorem (Physics)}\\"
 			r"&3. \text{ Monstrous Moonshine (String Theory)}\\"
 			r"&4. \text{ Periodic Tilings (Mathematics)}"
 		).scale(0.6)
 
-		addendum = MathTex(
+		addendum = cached_math_tex(
 			r"\text{The makers of the video are profoundly unknowledgeable about all the items in this list}"
 		).scale(0.4).shift(3.5 * DOWN)
 		self.play(FadeIn(uses), FadeIn(addendum))
 		self.wait(11)
 		self.play(FadeOut(uses), FadeOut(addendum))
 
-		orb = MathTex('\\text{Orbit-Stabilizer Theorem}').shift(UP * 0.25)
-		below_text_1 = MathTex('\\text{Nope, deeper than this}').scale(0.5).shift(DOWN * 0.40)
+		orb = cached_math_tex('\\text{Orbit-Stabilizer Theorem}').shift(UP * 0.25)
+		below_text_1 = cached_math_tex('\\text{Nope, deeper than this}').scale(0.5).shift(DOWN * 0.40)
 
 		self.play(FadeIn(orb))
 		self.play(FadeIn(below_text_1))
 		self.wait()
 
-		classification = MathTex('\\text{The Classification of Finite Simple Groups}').shift(UP * 0.25)
-		below_text_2 = MathTex('\\text{No, not }that\\text{ deep}').scale(0.5).shift(DOWN * 0.4)
+		classification = cached_math_tex('\\text{The Classification of Finite Simple Groups}').shift(UP * 0.25)
+		below_text_2 = cached_math_tex('\\text{No, not }that\\text{ deep}').scale(0.5).shift(DOWN * 0.4)
 
-		unsolvability = MathTex('\\text{Unsolvability of the Quintic}').shift(UP * 0.25)
-		below_text_3 = MathTex('\\text{Perfect!}').scale(0.5).shift(DOWN * 0.4)
+		unsolvability = cached_math_tex('\\text{Unsolvability of the Quintic}').shift(UP * 0.25)
+		below_text_3 = cached_math_tex('\\text{Perfect!}').scale(0.5).shift(DOWN * 0.4)
 
 		self.play(FadeOut(below_text_1), Transform(orb, classification))
 		self.play(FadeIn(below_text_2))
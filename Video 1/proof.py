@@ -2,6 +2,18 @@ from abc import ABC
 
 from manim import *
 
+from animations import MoveCenters, RadialScale, TranslateTo, submobject_centers
+from arrows import ArrowField, arrow_add_sticky_updater
+from cycle_layout import pack_cycles, ring_points
+from glyph_numbers import GlyphInteger
+from order_solver import least_degree_with_order, prime_power_tex
+from permutation import Permutation, SlotTracker
+from rendering import FrameReuseScene, HeldFrameScene
+from tex_cache import PrecompiledTexScene, cached_math_tex
+
+# the order the video is about; the scenes that state the problem or its answer derive everything from it
+ORDER = 1000
+
 
 class CustomArrowTip(ArrowTip, Triangle, ABC):
 	def __init__(self, **kwargs):
@@ -20,6 +32,8 @@ class Cycle:
 		self.length = len(self.dots)
 
 		self.arrows = []
+		self.arrow_field = None
+		self.arrow_group = VGroup()
 
 		self.dot_group = VGroup(*self.dots)
 		self.label_group = VGroup(*self.labels)
@@ -37,38 +51,46 @@ class Cycle:
 		for label in self.labels:
 			label.clear_updaters()
 
-	def make_arrows_normal(self):
-		if len(self.arrows) > 0:
-			for arrow in self.arrows:
-				arrow.clear_updaters()
-		else:
+	def make_arrows(self):
+		if len(self.arrows) == 0:
 			self.arrows = [
 				make_arrow_between(
 					self.dots[index], self.dots[(index + 1) % self.length]
 				) for index in range(self.length)
 			]
+			self.arrow_field = ArrowField(
+				self.arrows, self.dots, [(index, (index + 1) % self.length) for index in range(self.length)]
+			)
+			self.arrow_group = self.arrow_field.group
+
+	def make_arrows_normal(self):
+		self.make_arrows()
+		self.arrow_field.make_normal()
 
 	def make_arrows_sticky(self):
-		if len(self.arrows) > 0:
-			for index, arrow in enumerate(self.arrows):
-				arrow_add_sticky_updater(arrow, self.dots[index], self.dots[(index + 1) % self.length])
-		else:
-			self.arrows = [
-				make_sticky_arrow_between(
-					self.dots[index], self.dots[(index + 1) % self.length]
-				) for index in range(self.length)
-			]
+		# the arrows only follow the dots while arrow_group is in the scene
+		self.make_arrows()
+		self.arrow_field.make_sticky()
+
+	def get_radius(self):
+		return self.circle.width / 2
 
 	def change_center(self, new_center):
 		old_center = self.circle.get_center()
 		self.circle.move_to(new_center)
 		return ApplyMethod(self.dot_and_label_group.shift, new_center - old_center)
 
+	def fit(self, new_center, new_radius):
+		# moves and resizes the cycle in one animation, keeping every dot and label where it is relative to the circle
+		old_center = self.circle.get_center()
+		scale_factor = new_radius / self.get_radius()
+		self.circle.scale(scale_factor).move_to(new_center)
+		centers = submobject_centers(self.dot_and_label_group)
+		return MoveCenters(self.dot_and_label_group, new_center + (centers - old_center) * scale_factor)
+
 	def untangle(self):
-		methods = []
-		for index, dot in enumerate(self.dots):
-			methods.append(ApplyMethod(dot.move_to, self.circle.point_at_angle(index * TAU / self.length)))
-		return methods
+		# spreads the dots evenly around the circle, starting at angle 0
+		return MoveCenters(self.dot_group, ring_points(self.circle.get_center(), self.get_radius(), self.length))
 
 	def show_arrows(self, run_time=1, lag_ratio=0):
 		return [FadeIn(arrow, run_time=run_time, lag_ratio=lag_ratio) for arrow in self.arrows]
@@ -83,7 +105,99 @@ class Cycle:
 		return [FadeOut(label, run_time=run_time, lag_ratio=lag_ratio) for label in self.labels]
 
 	def scale(self, scale_factor):
-		pass
+		self.circle.scale(scale_factor)
+		return RadialScale(self.dot_and_label_group, self.circle.get_center(), scale_factor)
+
+
+def arrange_cycles(cycles, layout):
+	# one animation per cycle, taking it to its circle in a layout from pack_cycles
+	return [cycle.fit(center, radius) for cycle, center, radius in zip(cycles, layout.centers, layout.radii)]
+
+
+class CycleRotate(Animation):
+	# Moves every dot of every cycle onto its successor's position. A cycle is a Cycle or a plain list of dots.
+	def __init__(self, *cycles, along_arc=False, match_style=False, **kwargs):
+		self.cycles = [cycle.dots if isinstance(cycle, Cycle) else list(cycle) for cycle in cycles]
+		self.along_arc = along_arc
+		self.match_style = match_style
+		self.moving_dots = [dot for cycle in self.cycles for dot in cycle]
+		super().__init__(VGroup(*self.moving_dots), **kwargs)
+
+	def begin(self):
+		successors = [dot for cycle in self.cycles for dot in cycle[1:] + cycle[:1]]
+		self.start_centers = np.array([dot.get_center() for dot in self.moving_dots]).reshape(-1, 3)
+		self.end_centers = np.array([dot.get_center() for dot in successors]).reshape(-1, 3)
+		self.arc_angles = np.array([
+			TAU / len(cycle) if self.along_arc else 0 for cycle in self.cycles for _ in cycle
+		])
+
+		# every dot's points become a view into one shared buffer, so a frame is a single array update
+		point_counts = [len(dot.points) for dot in self.moving_dots]
+		self.point_counts = np.array(point_counts, dtype=int)
+		self.start_points = np.concatenate([dot.points for dot in self.moving_dots]) if point_counts else np.zeros((0, 3))
+		self.points = self.start_points.copy()
+		offset = 0
+		for dot, count in zip(self.moving_dots, point_counts):
+			dot.points = self.points[offset:offset + count]
+			offset += count
+
+		if self.match_style:
+			self.start_rgbas = {}
+			self.end_rgbas = {}
+			self.rgbas = {}
+			for array_name in ['fill_rgbas', 'stroke_rgbas']:
+				self.start_rgbas[array_name] = np.array([getattr(dot, array_name)[0] for dot in self.moving_dots]).reshape(-1, 4)
+				self.end_rgbas[array_name] = np.array([getattr(dot, array_name)[0] for dot in successors]).reshape(-1, 4)
+				self.rgbas[array_name] = self.start_rgbas[array_name].copy()
+				for index, dot in enumerate(self.moving_dots):
+					setattr(dot, array_name, self.rgbas[array_name][index:index + 1])
+
+		if self.suspend_mobject_updating:
+			self.mobject.suspend_updating()
+		self.interpolate(0)
+
+	def get_all_mobjects(self):
+		return [self.mobject]
+
+	def finish(self):
+		super().finish()
+		# gives every dot its own arrays again, instead of views into this animation's buffers
+		for dot in self.moving_dots:
+			dot.points = dot.points.copy()
+			if self.match_style:
+				dot.fill_rgbas = dot.fill_rgbas.copy()
+				dot.stroke_rgbas = dot.stroke_rgbas.copy()
+
+	def clean_up_from_scene(self, scene):
+		super().clean_up_from_scene(scene)
+		# play added the group wrapping the dots to the scene in their place; put the dots back on their own
+		scene.mobjects = [
+			dot for mobject in scene.mobjects for dot in (self.moving_dots if mobject is self.mobject else [mobject])
+		]
+
+	def interpolate_mobject(self, alpha):
+		alpha = self.rate_func(alpha)
+		vects = self.end_centers - self.start_centers
+		centers = self.start_centers + alpha * vects
+
+		on_arc = self.arc_angles != 0
+		if np.any(on_arc):
+			# same path as path_along_arc, with a different arc angle per row
+			angles = self.arc_angles[on_arc, None]
+			arc_vects = vects[on_arc]
+			arc_centers = self.start_centers[on_arc] + 0.5 * arc_vects
+			arc_centers[:, :2] += np.stack([-arc_vects[:, 1], arc_vects[:, 0]], axis=1) / 2 / np.tan(angles / 2)
+			relative = self.start_centers[on_arc] - arc_centers
+			cosines = np.cos(alpha * angles)
+			sines = np.sin(alpha * angles)
+			centers[on_arc, 0] = arc_centers[:, 0] + (cosines * relative[:, :1] - sines * relative[:, 1:2])[:, 0]
+			centers[on_arc, 1] = arc_centers[:, 1] + (sines * relative[:, :1] + cosines * relative[:, 1:2])[:, 0]
+
+		self.points[:] = self.start_points + np.repeat(centers - self.start_centers, self.point_counts, axis=0)
+
+		if self.match_style:
+			for array_name, rgbas in self.rgbas.items():
+				rgbas[:] = interpolate(self.start_rgbas[array_name], self.end_rgbas[array_name], alpha)
 
 
 def make_arrow_between(dot1, dot2):
@@ -98,15 +212,6 @@ def make_arrow_between(dot1, dot2):
 	return arrow
 
 
-def arrow_add_sticky_updater(arrow, dot1, dot2):
-	arrow.add_updater(
-		lambda arw: arw.put_start_and_end_on(
-			Line(start=dot1.get_center(), end=dot2.get_center()).scale(0.9).get_start(),
-			Line(start=dot1.get_center(), end=dot2.get_center()).scale(0.9).get_end()
-		)
-	)
-
-
 def make_sticky_arrow_between(dot1, dot2):
 	arrow = make_arrow_between(dot1, dot2)
 	arrow_add_sticky_updater(arrow, dot1, dot2)
@@ -114,78 +219,17 @@ def make_sticky_arrow_between(dot1, dot2):
 	return arrow
 
 
-def approx(array1, array2):
-	for element1, element2 in zip(array1, array2):
-		if not (element1 - 0.05 < element2 < element1 + 0.05):
-			return False
-	return True
-
-
-class Logo(Scene):
-	def construct(self):
-		num_integrals = 5
-
-		rate_func = rate_functions.ease_in_out_cubic
-		channel_name = MathTex(*[r'\text{The Geometers}']).shift(2.6 * DOWN)
-		initial_circ = Circle(radius=0.037, fill_color=BLUE, fill_opacity=1, stroke_color=BLUE, stroke_width=4)
-
-		circ_list = [initial_circ]
-		for current_radius in np.arange(0.037 * 2, 1, 0.037):
-			circ_list.append(
-				Circle(
-					radius=current_radius,
-					stroke_width=4,
-					stroke_color=BLUE,
-					stroke_opacity=np.exp(-6 * current_radius ** 2)
-				)
-			)
-		circles = VGroup(initial_circ, *circ_list)
-
-		integral_list = [MathTex(r'\int').rotate(PI * index / num_integrals).scale(3) for index in range(num_integrals)]
-		integrals = VGroup(*integral_list)
-
-		delay = 0.75
-		hacking_delay = Rotate(Square(1).set_opacity(0), run_time=delay)
-		integral_fade_ins = [hacking_delay]
-
-		def update_sector(mob, alpha):
-			mob.become(mob.set_opacity(interpolate(0, 1, alpha)))
-
-		run_time = 2
-		for integral in integrals[1:]:
-			integral_fade_ins.append(
-				UpdateFromAlphaFunc(
-					integral, update_sector, rate_func=rate_func, run_time=run_time - 2 * delay / (num_integrals - 1)
-				)
-			)
-
-		integral_fade_ins.append(hacking_delay)
-		fade_in_group = AnimationGroup(*integral_fade_ins, lag_ratio=1)
-
-		self.play(Write(integrals[0]), run_time=run_time)
-		self.play(
-			Rotate(integrals, angle=np.round(2 * np.pi, 5), run_time=4 * run_time, rate_func=rate_func),
-			fade_in_group,
-			Rotate(integrals[0], angle=np.round(2 * np.pi, 5), run_time=4 * run_time, rate_func=rate_func),
-			FadeIn(circles, run_time=4 * run_time),
-			Write(channel_name, run_time=4 * run_time)
-		)
-		self.wait()
-		self.play(
-			FadeOut(circles)
-		)
-		self.play(FadeOut(integrals), FadeOut(channel_name))
-
+class WriteQuestionToScreen(HeldFrameScene):
+	order = ORDER
 
-class WriteQuestionToScreen(Scene):
 	def construct(self):
-		text_part1 = MathTex(
+		text_part1 = cached_math_tex(
 			r"\text{Find the least positive integer } n"
 			r"\text{ for which there exists a permutation } f \text{ on } n \text{ objects}"
 		).scale(0.6).shift(UP * 0.5)
-		text_part2 = MathTex(
-			r"\text{ such that } f^{1000} \text{ is the identity function}"
-			r"\text{ and } 1000 \text{ is the least positive integer for which this holds.}"
+		text_part2 = cached_math_tex(
+			rf"\text{{ such that }} f^{{{self.order}}} \text{{ is the identity function}}"
+			rf"\text{{ and }} {self.order} \text{{ is the least positive integer for which this holds.}}"
 		).scale(0.6)
 
 		self.play(Write(text_part1))
@@ -195,13 +239,13 @@ class WriteQuestionToScreen(Scene):
 		self.wait()
 
 
-class ExplainingPermutations(Scene):
-	def permute(self, dots, permutation: dict):
+class ExplainingPermutations(HeldFrameScene):
+	def permute(self, dots, permutation: Permutation):
 		transforms = []
 		create_arcs = []
 		fadeout_arcs = []
 
-		for key, value in permutation.items():
+		for key, value in permutation.moves():
 			this = dots[key]
 			other = dots[value]
 			transforms.append(Transform(this, other, path_arc=PI))
@@ -226,19 +270,19 @@ class ExplainingPermutations(Scene):
 		self.play(*create_arcs)
 		self.play(*transforms, *fadeout_arcs)
 
-	def permute_no_arrows(self, dots, permutation: dict, run_time=1.0):
+	def permute_no_arrows(self, dots, permutation: Permutation, run_time=1.0):
 		transforms = []
 
-		for key, value in permutation.items():
+		for key, value in permutation.moves():
 			this = dots[key]
 			other = dots[value]
-			transforms.append(Transform(this, other, path_arc=PI, run_time=run_time))
+			transforms.append(TranslateTo(this, other, path_arc=PI, run_time=run_time))
 
 		return transforms
 
 	def construct(self):
 		dots = [Dot(RIGHT * mult) for mult in range(-2, 3)]
-		labels = [Integer(num + 1).scale(0.5).next_to(dot, DOWN) for num, dot in enumerate(dots)]
+		labels = [GlyphInteger(num + 1).scale(0.5).next_to(dot, DOWN) for num, dot in enumerate(dots)]
 
 		dots_copy = [dot.copy() for dot in dots]
 		labels_copy = [label.copy() for label in labels]
@@ -251,15 +295,15 @@ class ExplainingPermutations(Scene):
 		for dot, label in zip(dots, labels):
 			label.add_updater(lambda l, dot=dot, label=label: l.next_to(dot, DOWN))
 
-		permutation = {
+		permutation = Permutation.from_mapping({
 			0: 2,
 			1: 4,
 			2: 0,
 			3: 1,
 			4: 3
-		}
+		})
 
-		inverse = {v: k for k, v in permutation.items()}
+		inverse = permutation.inverse()
 
 		self.play(*[FadeIn(dot) for dot in dots], *[Write(label) for label in labels], run_time=0.5)
 		self.wait(3)
@@ -281,11 +325,11 @@ class ExplainingPermutations(Scene):
 
 		self.permute(dots, permutation)
 		scale_factor_table = 0.75
-		fof3 = MathTex("f(3)=1").move_to(5.75 * LEFT + 3.25 * UP).scale(scale_factor_table)
-		fof4 = MathTex("f(4)=2").move_to(5.75 * LEFT + 2.5 * UP).scale(scale_factor_table)
-		fof1 = MathTex("f(1)=3").move_to(5.75 * LEFT + 1.75 * UP).scale(scale_factor_table)
-		fof5 = MathTex("f(5)=4").move_to(5.75 * LEFT + 1 * UP).scale(scale_factor_table)
-		fof2 = MathTex("f(2)=5").move_to(5.75 * LEFT + 0.25 * UP).scale(scale_factor_table)
+		fof3 = cached_math_tex(f"f(3)={permutation(2) + 1}").move_to(5.75 * LEFT + 3.25 * UP).scale(scale_factor_table)
+		fof4 = cached_math_tex(f"f(4)={permutation(3) + 1}").move_to(5.75 * LEFT + 2.5 * UP).scale(scale_factor_table)
+		fof1 = cached_math_tex(f"f(1)={permutation(0) + 1}").move_to(5.75 * LEFT + 1.75 * UP).scale(scale_factor_table)
+		fof5 = cached_math_tex(f"f(5)={permutation(4) + 1}").move_to(5.75 * LEFT + 1 * UP).scale(scale_factor_table)
+		fof2 = cached_math_tex(f"f(2)={permutation(1) + 1}").move_to(5.75 * LEFT + 0.25 * UP).scale(scale_factor_table)
 
 		self.wait(4)
 		self.play(Write(fof3))
@@ -299,64 +343,30 @@ class ExplainingPermutations(Scene):
 		self.play(Write(fof2, run_time=1))
 		self.wait(10)
 
-		comp_notation = [
-			Transform(fof1, MathTex(r"(f \circ f)(1) = 1").move_to(fof1.get_center()).scale(scale_factor_table)),
-			Transform(fof2, MathTex(r"(f \circ f)(2) = 4").move_to(fof2.get_center()).scale(scale_factor_table)),
-			Transform(fof3, MathTex(r"(f \circ f)(3) = 3").move_to(fof3.get_center()).scale(scale_factor_table)),
-			Transform(fof4, MathTex(r"(f \circ f)(4) = 5").move_to(fof4.get_center()).scale(scale_factor_table)),
-			Transform(fof5, MathTex(r"(f \circ f)(5) = 2").move_to(fof5.get_center()).scale(scale_factor_table)),
-		]
-		func_exp_notation = [
-			Transform(fof1, MathTex(r"f^2(1) = 1").move_to(fof1.get_center()).scale(scale_factor_table)),
-			Transform(fof2, MathTex(r"f^2(2) = 4").move_to(fof2.get_center()).scale(scale_factor_table)),
-			Transform(fof3, MathTex(r"f^2(3) = 3").move_to(fof3.get_center()).scale(scale_factor_table)),
-			Transform(fof4, MathTex(r"f^2(4) = 5").move_to(fof4.get_center()).scale(scale_factor_table)),
-			Transform(fof5, MathTex(r"f^2(5) = 2").move_to(fof5.get_center()).scale(scale_factor_table)),
-		]
+		fofs = [fof1, fof2, fof3, fof4, fof5]
+
+		def power_table(power, notation):
+			# notation is formatted with the power, each element and its image, all counted from 1
+			images = permutation.power(power)
+			return [
+				Transform(
+					fof,
+					cached_math_tex(notation.format(power=power, element=element + 1, image=images(element) + 1))
+					.move_to(fof.get_center()).scale(scale_factor_table)
+				)
+				for element, fof in enumerate(fofs)
+			]
+
+		comp_notation = power_table(2, r"(f \circ f)({element}) = {image}")
+		func_exp_notation = power_table(2, r"f^{power}({element}) = {image}")
 
 		self.play(*self.permute_no_arrows(dots, permutation, run_time=1.1), *comp_notation)
 		self.play(*func_exp_notation)
 		self.wait()
 
-		func_exp_notation = [
-			Transform(fof1, MathTex(r"f^3(1) = 3").move_to(fof1.get_center()).scale(scale_factor_table)),
-			Transform(fof2, MathTex(r"f^3(2) = 2").move_to(fof2.get_center()).scale(scale_factor_table)),
-			Transform(fof3, MathTex(r"f^3(3) = 1").move_to(fof3.get_center()).scale(scale_factor_table)),
-			Transform(fof4, MathTex(r"f^3(4) = 4").move_to(fof4.get_center()).scale(scale_factor_table)),
-			Transform(fof5, MathTex(r"f^3(5) = 5").move_to(fof5.get_center()).scale(scale_factor_table)),
-		]
-
-		self.play(*self.permute_no_arrows(dots, permutation, run_time=1.1), *func_exp_notation)
-
-		func_exp_notation = [
-			Transform(fof1, MathTex(r"f^4(1) = 1").move_to(fof1.get_center()).scale(scale_factor_table)),
-			Transform(fof2, MathTex(r"f^4(2) = 5").move_to(fof2.get_center()).scale(scale_factor_table)),
-			Transform(fof3, MathTex(r"f^4(3) = 3").move_to(fof3.get_center()).scale(scale_factor_table)),
-			Transform(fof4, MathTex(r"f^4(4) = 2").move_to(fof4.get_center()).scale(scale_factor_table)),
-			Transform(fof5, MathTex(r"f^4(5) = 4").move_to(fof5.get_center()).scale(scale_factor_table)),
-		]
-
-		self.play(*self.permute_no_arrows(dots, permutation, run_time=1.1), *func_exp_notation)
-
-		func_exp_notation = [
-			Transform(fof1, MathTex(r"f^5(1) = 3").move_to(fof1.get_center()).scale(scale_factor_table)),
-			Transform(fof2, MathTex(r"f^5(2) = 4").move_to(fof2.get_center()).scale(scale_factor_table)),
-			Transform(fof3, MathTex(r"f^5(3) = 1").move_to(fof3.get_center()).scale(scale_factor_table)),
-			Transform(fof4, MathTex(r"f^5(4) = 5").move_to(fof4.get_center()).scale(scale_factor_table)),
-			Transform(fof5, MathTex(r"f^5(5) = 2").move_to(fof5.get_center()).scale(scale_factor_table)),
-		]
-
-		self.play(*self.permute_no_arrows(dots, permutation, run_time=1.1), *func_exp_notation)
-
-		func_exp_notation = [
-			Transform(fof1, MathTex(r"f^6(1) = 1").move_to(fof1.get_center()).scale(scale_factor_table)),
-			Transform(fof2, MathTex(r"f^6(2) = 2").move_to(fof2.get_center()).scale(scale_factor_table)),
-			Transform(fof3, MathTex(r"f^6(3) = 3").move_to(fof3.get_center()).scale(scale_factor_table)),
-			Transform(fof4, MathTex(r"f^6(4) = 4").move_to(fof4.get_center()).scale(scale_factor_table)),
-			Transform(fof5, MathTex(r"f^6(5) = 5").move_to(fof5.get_center()).scale(scale_factor_table)),
-		]
-
-		self.play(*self.permute_no_arrows(dots, permutation, run_time=1.1), *func_exp_notation)
+		for power in range(3, permutation.order() + 1):
+			func_exp_notation = power_table(power, r"f^{power}({element}) = {image}")
+			self.play(*self.permute_no_arrows(dots, permutation, run_time=1.1), *func_exp_notation)
 
 		self.play(FadeOut(group_of_copy_dots), FadeOut(group_of_labels_copy))
 		self.play(
@@ -364,7 +374,7 @@ class ExplainingPermutations(Scene):
 		)
 		self.wait(12)
 
-		text = MathTex(r"f^6 = \text{Identity}").shift(UP * 2)
+		text = cached_math_tex(rf"f^{permutation.order()} = \text{{Identity}}").shift(UP * 2)
 		self.play(Write(text))
 
 		self.wait(5)
@@ -388,35 +398,33 @@ class ExplainingPermutations(Scene):
 		self.play(FadeOut(group_of_dots), FadeOut(group_of_labels))
 
 
-class RotationPermutationWith1000(Scene):
+class RotationPermutationWith1000(HeldFrameScene):
 	num_permutes = 0
-	counter = Integer(0).scale(0.5).move_to(RIGHT * 6.5 + UP * 3.5)
+	counter = GlyphInteger(0).scale(0.5).move_to(RIGHT * 6.5 + UP * 3.5)
 
-	def rotate_permutation(self, dots, labels, dot_loc, label_loc, fadein_arrows=True, fadeout_arrows=True, foa=None):
+	def rotate_permutation(self, dots, labels, slots, hidden_slot, fadein_arrows=True, fadeout_arrows=True, foa=None):
 		transforms = []
 		fade_in_arrows = []
 		fade_out_arrows = []
-		for index in range(20):
+		for index in range(len(dots)):
 			this_dot = dots[index - 1]
 			next_dot = dots[index]
 			this_label = labels[index - 1]
 			next_label = labels[index]
+			this_hidden = slots.slot(index - 1) == hidden_slot
+			next_hidden = slots.slot(index) == hidden_slot
 
 			transforms.append(Transform(this_dot, next_dot))
 
-			if approx(this_label.get_center(), label_loc):
+			if this_hidden:
 				this_label.set_value(next_label.get_value() - 1)
 
 			target_label = this_label.copy().move_to(next_label.get_center())
-
-			if approx(next_label.get_center(), label_loc):
-				target_label.set_color(BLACK)
-			else:
-				target_label.set_color(WHITE)
+			target_label.set_color(BLACK if next_hidden else WHITE)
 
 			transforms.append(Transform(this_label, target_label))
 
-			if not (approx(next_dot.get_center(), dot_loc) or approx(this_dot.get_center(), dot_loc)):
+			if not (next_hidden or this_hidden):
 				arrow = make_arrow_between(this_dot, next_dot)
 				fade_in_arrows.append(FadeIn(arrow))
 				fade_out_arrows.append(FadeOut(arrow))
@@ -426,6 +434,7 @@ class RotationPermutationWith1000(Scene):
 
 		self.num_permutes += 1
 		self.play(*transforms, ApplyMethod(self.counter.set_value, self.num_permutes))
+		slots.advance(Permutation.from_cycles([range(len(dots))], len(dots)))
 
 		if fadeout_arrows:
 			if foa is None:
@@ -449,40 +458,41 @@ class RotationPermutationWith1000(Scene):
 			points.append(p)
 			d = Dot(point=p)
 			dots.append(d)
-			label = Integer(number=c + 1).move_to(p * 1.15).scale(0.5)
+			label = GlyphInteger(number=c + 1).move_to(p * 1.15).scale(0.5)
 			labels.append(label)
 
 		for c in range(1, 7, 1):
 			labels[-c].set_value(1001 - c)
 
-		dot_loc = dots[13].get_center()
-		label_loc = labels[13].get_center()
-		dots[13].set_color(BLACK)
-		labels[13].set_color(BLACK)
+		# the slot behind the '...' stays fixed while the dots and labels rotate through it
+		slots = SlotTracker(num_points)
+		hidden_slot = 13
+		dots[hidden_slot].set_color(BLACK)
+		labels[hidden_slot].set_color(BLACK)
 
 		angle = Line(start=dots[12].get_center(), end=dots[14].get_center()).get_angle()
-		etc = Text('...').move_to(dot_loc).rotate(angle)
+		etc = Text('...').move_to(dots[hidden_slot]).rotate(angle)
 
 		self.play(*[FadeIn(dot) for dot in dots], *[FadeIn(label) for label in labels], FadeIn(etc),
 		          FadeIn(self.counter))
 
-		foa = self.rotate_permutation(dots, labels, dot_loc, label_loc, fadein_arrows=True, fadeout_arrows=False)
+		foa = self.rotate_permutation(dots, labels, slots, hidden_slot, fadein_arrows=True, fadeout_arrows=False)
 		self.wait(0.25)
 
 		for _ in range(12):
-			self.rotate_permutation(dots, labels, dot_loc, label_loc, fadein_arrows=False, fadeout_arrows=False)
+			self.rotate_permutation(dots, labels, slots, hidden_slot, fadein_arrows=False, fadeout_arrows=False)
 			self.wait(0.5)
 
-		self.rotate_permutation(dots, labels, dot_loc, label_loc, fadein_arrows=False, fadeout_arrows=True, foa=foa)
+		self.rotate_permutation(dots, labels, slots, hidden_slot, fadein_arrows=False, fadeout_arrows=True, foa=foa)
 		self.wait(1.75)
 
 		self.play(*[FadeOut(dot) for dot in dots], *[FadeOut(label) for label in labels], FadeOut(etc),
 		          FadeOut(self.counter))
 
 
-class RotationPermutationWith4(Scene):
+class RotationPermutationWith4(FrameReuseScene):
 	num_permutes = 0
-	counter = Integer(0).scale(0.5).move_to(RIGHT * 6.5 + UP * 3.5)
+	counter = GlyphInteger(0).scale(0.5).move_to(RIGHT * 6.5 + UP * 3.5)
 
 	def rotate_permutation(self, dots, labels, fadein_arrows=True, fadeout_arrows=True, foa=None):
 		transforms = []
@@ -494,12 +504,8 @@ class RotationPermutationWith4(Scene):
 			this_label = labels[index - 1]
 			next_label = labels[index]
 
-			transforms.append(Transform(this_dot, next_dot))
-
-			target_label = this_label.copy().move_to(next_label.get_center())
-			target_label.set_color(WHITE)
-
-			transforms.append(Transform(this_label, target_label))
+			transforms.append(TranslateTo(this_dot, next_dot))
+			transforms.append(TranslateTo(this_label, next_label))
 
 			arrow = make_arrow_between(this_dot, next_dot)
 			fade_in_arrows.append(FadeIn(arrow))
@@ -509,7 +515,8 @@ class RotationPermutationWith4(Scene):
 			self.play(*fade_in_arrows)
 
 		self.num_permutes += 1
-		self.play(*transforms, ApplyMethod(self.counter.set_value, self.num_permutes))
+		# after every 4 steps the dots and labels are back where they started, so only the counter differs
+		self.play_repeatable('rotate', *transforms, ApplyMethod(self.counter.set_value, self.num_permutes))
 
 		if fadeout_arrows:
 			if foa is None:
@@ -520,6 +527,9 @@ class RotationPermutationWith4(Scene):
 		return fade_out_arrows
 
 	def construct(self):
+		# the counter is drawn over the reused frames of repeated steps
+		self.declare_volatile(self.counter)
+
 		circle = Circle(radius=3, color=BLACK)
 
 		num_points = 4
@@ -533,7 +543,7 @@ class RotationPermutationWith4(Scene):
 			points.append(p)
 			d = Dot(point=p)
 			dots.append(d)
-			label = Integer(number=c + 1).move_to(p * 1.15).scale(0.5)
+			label = GlyphInteger(number=c + 1).move_to(p * 1.15).scale(0.5)
 			labels.append(label)
 
 		self.play(*[FadeIn(dot) for dot in dots], *[FadeIn(label) for label in labels], FadeIn(self.counter))
@@ -551,26 +561,21 @@ class RotationPermutationWith4(Scene):
 		self.play(*[FadeOut(dot) for dot in dots], *[FadeOut(label) for label in labels], FadeOut(self.counter))
 
 
-class BringingInto2Circles(ZoomedScene, MovingCameraScene):
+class BringingInto2Circles(HeldFrameScene, ZoomedScene, MovingCameraScene):
 	num_permutes = 0
-	counter = Integer(0).scale(1).move_to(RIGHT * 13 + UP * 3)
+	counter = GlyphInteger(0).scale(1).move_to(RIGHT * 13 + UP * 3)
 
-	def permute1(self, dots, labels, permutations):
+	def permute1(self, dots, labels, permutation):
 		transforms = []
 		write_arrows = []
 		fade_out_arrows = []
 		fade_out_labels = [FadeOut(label) for label in labels]
 
-		for permutation in permutations:
-			for index in range(len(permutation) - 1):
-				transforms.append(
-					Transform(
-						dots[permutation[index]], dots[permutation[index + 1]]
-					)
-				)
-				arrow = make_arrow_between(dots[permutation[index]], dots[permutation[index + 1]])
-				write_arrows.append(Write(arrow))
-				fade_out_arrows.append(FadeOut(arrow))
+		for index, image in permutation.moves():
+			transforms.append(TranslateTo(dots[index], dots[image]))
+			arrow = make_arrow_between(dots[index], dots[image])
+			write_arrows.append(Write(arrow))
+			fade_out_arrows.append(FadeOut(arrow))
 
 		self.play(*write_arrows, run_time=1)
 		self.play(*fade_out_labels, run_time=0.5)
@@ -582,41 +587,32 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 
 		self.play(*fade_in_labels)
 
-	def permute2(self, dots, labels, permutations, *cycles):
+	def permute2(self, dots, labels, permutation, *cycles):
 		speed_ratio = 1.5
-		transforms = []
 		fade_out_labels = [FadeOut(label) for label in labels]
 		fade_in_labels = [FadeIn(label) for label in labels]
 
-		for permutation in permutations:
-			for index in range(len(permutation) - 1):
-				transforms.append(Transform(dots[permutation[index]], dots[permutation[index + 1]]))
-
-		for cycle in cycles:
-			for index in range(cycle.length):
-				transforms.append(Transform(cycle.dots[index - 1], cycle.dots[index]))
+		ring_cycles = [[dots[index] for index in cycle] for cycle in permutation.cycles()]
 
 		self.play(*fade_out_labels, run_time=0.5 / speed_ratio)
 
 		self.num_permutes += 1
-		self.play(*transforms, ApplyMethod(self.counter.set_value, self.num_permutes), run_time=1.5 / speed_ratio)
+		self.play(
+			CycleRotate(*ring_cycles, *cycles), ApplyMethod(self.counter.set_value, self.num_permutes),
+			run_time=1.5 / speed_ratio
+		)
 
 		for label, dot in zip(labels, dots):
 			label.move_to(dot.get_center() * 1.15)
 
 		self.play(*fade_in_labels, run_time=0.5 / speed_ratio)
 
-	def unpermute(self, dots, labels, permutations):
+	def unpermute(self, dots, labels, permutation):
 		transforms = []
 		fade_out_labels = [FadeOut(label) for label in labels]
 
-		for permutation in permutations:
-			for index in range(len(permutation) - 1):
-				transforms.append(
-					Transform(
-						dots[permutation[index + 1]], dots[permutation[index]]
-					)
-				)
+		for index, image in permutation.inverse().moves():
+			transforms.append(TranslateTo(dots[index], dots[image]))
 
 		self.play(*fade_out_labels, run_time=0.5)
 		self.play(*transforms, run_time=1)
@@ -639,12 +635,12 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 			p = circle.point_at_angle(angle)
 			d = Dot(point=p)
 			dots.append(d)
-			label = MathTex(f"{c + 1}").move_to(p * 1.15).scale(0.5)
+			label = cached_math_tex(f"{c + 1}").move_to(p * 1.15).scale(0.5)
 			labels.append(label)
 
-		labels[-1] = MathTex(f"n").move_to(labels[-1].get_center()).scale(0.5)
+		labels[-1] = cached_math_tex(f"n").move_to(labels[-1].get_center()).scale(0.5)
 		for c in range(2, 7, 1):
-			labels[-c] = MathTex(f"n - {c - 1}").move_to(labels[-c].get_center()).scale(0.5)
+			labels[-c] = cached_math_tex(f"n - {c - 1}").move_to(labels[-c].get_center()).scale(0.5)
 
 		# Hides the 14th dot and puts a '...' in its place
 		dot_loc = dots[13].get_center()
@@ -657,15 +653,18 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 		self.play(*[FadeIn(dot) for dot in dots], *[FadeIn(label) for label in labels], FadeIn(etc))
 		self.wait(2)
 
-		permutations = [
-			[0, 4, 10, 16, 7, 0],
-			[3, 9, 18, 14, 3],
-			[11, 12, 8, 17, 19, 6, 5, 15, 1, 2, 11]
-		]
+		permutation = Permutation.from_cycles(
+			[
+				[0, 4, 10, 16, 7],
+				[3, 9, 18, 14],
+				[11, 12, 8, 17, 19, 6, 5, 15, 1, 2]
+			],
+			num_points
+		)
 
-		self.permute1(dots, labels, permutations)
+		self.permute1(dots, labels, permutation)
 		self.wait(0.5)
-		self.unpermute(dots, labels, permutations)
+		self.unpermute(dots, labels, permutation)
 
 		darken_dots = []
 		lighten_dots = []
@@ -696,25 +695,25 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 		self.play(ApplyMethod(dots[3].set_color, RED, run_time=0.5))
 		self.play(ApplyMethod(dots[11].set_color, BLUE_E, run_time=0.5))
 
-		cycle1order = permutations[1]
-		cycle2order = permutations[2]
+		cycle1order = permutation.cycle_containing(3)
+		cycle2order = permutation.cycle_containing(11)
 		cycle1arrows = []
 		cycle2arrows = []
 
-		for index in range(1, len(cycle1order)):
-			cycle1arrows.append(make_arrow_between(dots[cycle1order[index - 1]], dots[cycle1order[index]]))
-		for index in range(1, len(cycle2order)):
-			cycle2arrows.append(make_arrow_between(dots[cycle2order[index - 1]], dots[cycle2order[index]]))
+		for index in range(len(cycle1order)):
+			cycle1arrows.append(make_arrow_between(dots[cycle1order[index]], dots[permutation(cycle1order[index])]))
+		for index in range(len(cycle2order)):
+			cycle2arrows.append(make_arrow_between(dots[cycle2order[index]], dots[permutation(cycle2order[index])]))
 
 		self.wait()
 		self.play(
 			*[Write(arrow) for arrow in cycle1arrows],
-			*[ApplyMethod(dots[index].set_color, RED) for index in permutations[1][1:-1]],
+			*[ApplyMethod(dots[index].set_color, RED) for index in cycle1order[1:]],
 			run_time=0.75
 		)
 		self.play(
 			*[Write(arrow) for arrow in cycle2arrows],
-			*[ApplyMethod(dots[index].set_color, BLUE_E) for index in permutations[2][1:-1]],
+			*[ApplyMethod(dots[index].set_color, BLUE_E) for index in cycle2order[1:]],
 			run_time=0.75
 		)
 
@@ -725,21 +724,21 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 
 		cycle1 = Cycle(
 			circle=circle.copy(),
-			dots=[dots[index].copy() for index in cycle1order[:-1]],
-			labels=[labels[index].copy() for index in cycle1order[:-1]]
+			dots=[dots[index].copy() for index in cycle1order],
+			labels=[labels[index].copy() for index in cycle1order]
 		)
 
 		cycle2 = Cycle(
 			circle=circle.copy(),
-			dots=[dots[index].copy() for index in cycle2order[:-1]],
-			labels=[labels[index].copy() for index in cycle2order[:-1]]
+			dots=[dots[index].copy() for index in cycle2order],
+			labels=[labels[index].copy() for index in cycle2order]
 		)
 
 		cycle1.make_arrows_sticky()
 		cycle2.make_arrows_sticky()
 
-		self.add(*cycle1.dots, *cycle1.labels, *cycle1.arrows)
-		self.add(*cycle2.dots, *cycle2.labels, *cycle2.arrows)
+		self.add(*cycle1.dots, *cycle1.labels, cycle1.arrow_group)
+		self.add(*cycle2.dots, *cycle2.labels, cycle2.arrow_group)
 		self.play(
 			cycle1.change_center(6 * LEFT + 8 * DOWN), cycle2.change_center(6 * RIGHT + 8 * DOWN),
 			FadeIn(self.counter)
@@ -750,7 +749,7 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 
 		# untangles the dots and arrows
 		self.wait(2.5)
-		self.play(*cycle1.untangle(), *cycle2.untangle())
+		self.play(cycle1.untangle(), cycle2.untangle())
 
 		cycle1.make_arrows_normal()
 		cycle2.make_arrows_normal()
@@ -758,7 +757,7 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 		self.wait()
 
 		for _ in range(20):
-			self.permute2(dots, labels, permutations, cycle1, cycle2)
+			self.permute2(dots, labels, permutation, cycle1, cycle2)
 
 		self.wait()
 		self.play(
@@ -771,18 +770,14 @@ class BringingInto2Circles(ZoomedScene, MovingCameraScene):
 		)
 
 
-class BreakingCircleIntoCycles(ZoomedScene, MovingCameraScene):
+class BreakingCircleIntoCycles(HeldFrameScene, ZoomedScene, MovingCameraScene):
+	order = ORDER
 	num_permutes = 0
-	counter = Integer(0).scale(1).move_to(RIGHT * 13 + UP * 7)
+	counter = GlyphInteger(0).scale(1).move_to(RIGHT * 13 + UP * 7)
 
 	def permute(self, *cycles):
-		transforms = []
-		for cycle in cycles:
-			for index in range(cycle.length):
-				transforms.append(Transform(cycle.dots[index - 1], cycle.dots[index], run_time=2))
-
 		self.num_permutes += 1
-		self.play(*transforms, ApplyMethod(self.counter.set_value, self.num_permutes))
+		self.play(CycleRotate(*cycles, run_time=2), ApplyMethod(self.counter.set_value, self.num_permutes))
 
 	def construct(self):
 		circle = Circle(radius=3)
@@ -796,12 +791,12 @@ class BreakingCircleIntoCycles(ZoomedScene, MovingCameraScene):
 			p = circle.point_at_angle(angle)
 			d = Dot(point=p)
 			dots.append(d)
-			label = MathTex(f"{c + 1}").move_to(p * 1.15).scale(0.5)
+			label = cached_math_tex(f"{c + 1}").move_to(p * 1.15).scale(0.5)
 			labels.append(label)
 
-		labels[-1] = MathTex(f"n").move_to(labels[-1].get_center()).scale(0.5)
+		labels[-1] = cached_math_tex(f"n").move_to(labels[-1].get_center()).scale(0.5)
 		for c in range(2, 7, 1):
-			labels[-c] = MathTex(f"n - {c - 1}").move_to(labels[-c].get_center()).scale(0.5)
+			labels[-c] = cached_math_tex(f"n - {c - 1}").move_to(labels[-c].get_center()).scale(0.5)
 
 		# Hides the 14th dot and puts a '...' in its place
 		dot_loc = dots[13].get_center()
@@ -814,32 +809,35 @@ class BreakingCircleIntoCycles(ZoomedScene, MovingCameraScene):
 		self.play(*[FadeIn(dot) for dot in dots], *[FadeIn(label) for label in labels], FadeIn(etc))
 		self.wait(2)
 
-		permutations = [
-			[0, 4, 10, 16, 7, 0],
-			[3, 9, 18, 14, 3],
-			[11, 12, 8, 17, 19, 6, 5, 15, 1, 2, 11]
-		]
+		permutation = Permutation.from_cycles(
+			[
+				[0, 4, 10, 16, 7],
+				[3, 9, 18, 14],
+				[11, 12, 8, 17, 19, 6, 5, 15, 1, 2]
+			],
+			num_points
+		)
 
-		cycle1order = permutations[1]
-		cycle2order = permutations[2]
-		cycleMorder = permutations[0]
+		cycle1order = permutation.cycle_containing(3)
+		cycle2order = permutation.cycle_containing(11)
+		cycleMorder = permutation.cycle_containing(0)
 
 		cycle1 = Cycle(
 			circle=circle.copy(),
-			dots=[dots[index] for index in cycle1order[:-1]],
-			labels=[labels[index] for index in cycle1order[:-1]]
+			dots=[dots[index] for index in cycle1order],
+			labels=[labels[index] for index in cycle1order]
 		)
 
 		cycle2 = Cycle(
 			circle=circle.copy(),
-			dots=[dots[index] for index in cycle2order[:-1]],
-			labels=[labels[index] for index in cycle2order[:-1]]
+			dots=[dots[index] for index in cycle2order],
+			labels=[labels[index] for index in cycle2order]
 		)
 
 		cycleM = Cycle(
 			circle=circle.copy(),
-			dots=[dots[index] for index in cycleMorder[:-1]],
-			labels=[labels[index] for index in cycleMorder[:-1]]
+			dots=[dots[index] for index in cycleMorder],
+			labels=[labels[index] for index in cycleMorder]
 		)
 
 		cycle1.make_arrows_sticky()
@@ -851,27 +849,29 @@ class BreakingCircleIntoCycles(ZoomedScene, MovingCameraScene):
 		self.add(*cycle1.dots, *cycle1.labels)
 		self.add(*cycle2.dots, *cycle2.labels)
 		self.add(*cycleM.dots, *cycleM.labels)
+		self.add(cycle1.arrow_group, cycle2.arrow_group, cycleM.arrow_group)
 
 		self.play(
 			*cycle1.show_arrows(), *cycle2.show_arrows(), *cycleM.show_arrows()
 		)
-		# total screen width at this point is 256/9
-		left_end = LEFT * (128 / 9)
-		right_end = RIGHT * (128 / 9)
+		# spreads the cycles across the whole frame, leaving room for a '...' between cycle 2 and cycle m
 		mystic_space = 1.5
-		buffer = ((256 / 9) - (18 + 3 * mystic_space)) / 3
+		frame = self.camera.frame
+		cycles = [cycle1, cycle2, cycleM]
+		layout = pack_cycles(
+			[cycle.length for cycle in cycles], frame.width, frame.height, frame.get_center(),
+			radius=3, gaps={1: 3 * mystic_space}
+		)
 
-		mystical_dot = Dot(right_end + (buffer + 6 + 1.5 * mystic_space) * LEFT).set_color(BLACK)
-		mystical_etc = Text('...').move_to(right_end + (buffer + 6 + 1.5 * mystic_space) * LEFT)
+		mystical_dot = Dot(layout.gap_centers[1]).set_color(BLACK)
+		mystical_etc = Text('...').move_to(layout.gap_centers[1])
 
-		cycle1name = Text('Cycle 1').move_to(left_end + (buffer + 3) * RIGHT + 4 * DOWN).scale(0.5)
-		cycle2name = Text('Cycle 2').move_to(left_end + (buffer + 6 + buffer + 3) * RIGHT + 4 * DOWN).scale(0.5)
-		cycleMname = Text('Cycle m').move_to(right_end + (buffer + 3) * LEFT + 4 * DOWN).scale(0.5)
+		cycle1name = Text('Cycle 1').move_to(layout.centers[0] + 4 * DOWN).scale(0.5)
+		cycle2name = Text('Cycle 2').move_to(layout.centers[1] + 4 * DOWN).scale(0.5)
+		cycleMname = Text('Cycle m').move_to(layout.centers[2] + 4 * DOWN).scale(0.5)
 
 		self.play(
-			cycle1.change_center(left_end + (buffer + 3) * RIGHT),
-			cycle2.change_center(left_end + (buffer + 6 + buffer + 3) * RIGHT),
-			cycleM.change_center(right_end + (buffer + 3) * LEFT),
+			*arrange_cycles(cycles, layout),
 			Transform(dots[13], mystical_dot),
 			Transform(labels[13], mystical_dot),
 			Transform(etc, mystical_etc),
@@ -887,7 +887,7 @@ class BreakingCircleIntoCycles(ZoomedScene, MovingCameraScene):
 
 		# untangles the dots and arrows
 		self.wait()
-		self.play(*cycle1.untangle(), *cycle2.untangle(), *cycleM.untangle())
+		self.play(cycle1.untangle(), cycle2.untangle(), cycleM.untangle())
 		self.wait()
 
 		cycle1.make_arrows_normal()
@@ -917,9 +917,9 @@ class BreakingCircleIntoCycles(ZoomedScene, MovingCameraScene):
 			ApplyMethod(etc.shift, 4 * UP)
 		)
 
-		equation1 = MathTex(r"f^{\text{lcm}(c_1, c_2, ..., c_m)} = \text{Identity}").shift(2 * DOWN).scale(2)
-		equation2 = MathTex(r"\text{lcm}(c_1, c_2, ..., c_m) = 1000").shift(4 * DOWN + 1.3 * LEFT).scale(2)
-		equation3 = MathTex(r"c_1 + c_2 + ... + c_m = n").shift(6 * DOWN + 2 * LEFT).scale(2)
+		equation1 = cached_math_tex(r"f^{\text{lcm}(c_1, c_2, ..., c_m)} = \text{Identity}").shift(2 * DOWN).scale(2)
+		equation2 = cached_math_tex(rf"\text{{lcm}}(c_1, c_2, ..., c_m) = {self.order}").shift(4 * DOWN + 1.3 * LEFT).scale(2)
+		equation3 = cached_math_tex(r"c_1 + c_2 + ... + c_m = n").shift(6 * DOWN + 2 * LEFT).scale(2)
 		self.play(Write(equation1))
 		self.wait(16)
 		self.play(Write(equation2))
@@ -939,15 +939,46 @@ class BreakingCircleIntoCycles(ZoomedScene, MovingCameraScene):
 		)
 
 
-class Solving(Scene):
+class Solving(PrecompiledTexScene, HeldFrameScene):
+	order = ORDER
+
+	def tex_names(self):
+		solution = least_degree_with_order(self.order)
+		# the derivation below splits every c_i into a power of p times a power of q
+		if len(solution.prime_powers) != 2:
+			raise ValueError(f'Solving needs an order with exactly two prime factors, not {self.order}')
+
+		power_texs = [prime_power_tex(prime, exponent) for prime, exponent in solution.prime_powers]
+		p, q = (str(prime) for prime, _ in solution.prime_powers)
+		return {
+			'p': p,
+			'q': q,
+			'power_texs': power_texs,
+			'order_tex': str(self.order),
+			'product_tex': r" \cdot ".join(power_texs),
+			'parts_tex': ", ".join(power_texs),
+			'sum_tex': " + ".join(power_texs),
+			'degree_tex': str(solution.degree)
+		}
+
 	def construct(self):
+		# the same values the tex strings were precompiled from
+		names = self.tex_names()
+		p, q = names['p'], names['q']
+		power_texs = names['power_texs']
+		order_tex = names['order_tex']
+		product_tex = names['product_tex']
+		parts_tex = names['parts_tex']
+		sum_tex = names['sum_tex']
+		degree_tex = names['degree_tex']
+
 		self.wait(3.5)
 
-		equations = MathTex(
+		equations = cached_math_tex(
 			r"\text{lcm}(",
 			r"c_1, c_2, c_3, c_4, \dots, c_m",
 			")&=",
-			"1000",
+			order_tex,
 			r"\\",
 			r"c_1 + c_2 + c_3 + c_4 + \dots + c_m",
 			"&= n"
@@ -955,11 +986,11 @@ class Solving(Scene):
 
 		self.play(FadeIn(equations))
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"\text{lcm}(",
 			r"c_1, c_2, c_3, c_4, \dots, c_m",
 			")&=",
-			r"2^3 \cdot 5^3",
+			product_tex,
 			r"\\",
 			r"c_1 + c_2 + c_3 + c_4 + \dots + c_m",
 			"&= n"
@@ -968,100 +999,100 @@ class Solving(Scene):
 		self.play(
 			Transform(
 				equations[3],
-				MathTex(r"2^3 \cdot 5^3").set_x(step[3].get_x() - step[2].get_x() + equations[2].get_x()).set_y(step[3].get_y()),
+				cached_math_tex(product_tex).set_x(step[3].get_x() - step[2].get_x() + equations[2].get_x()).set_y(step[3].get_y()),
 			)
 		)
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"\text{lcm}(",
-			r"1000",
+			order_tex,
 			")&=",
-			r"2^3 \cdot 5^3",
+			product_tex,
 			r"\\",
-			r"1000",
+			order_tex,
 			"&= n"
 		)
 		self.wait(11.5)
 		self.play(
 			*[ApplyMethod(equations[index].move_to, step[index]) for index in [0, 2, 3, 4, 6]],
-			Transform(equations[1], MathTex(r"1000").move_to(step[1])),
-			Transform(equations[5], MathTex(r"1000").move_to(step[5]))
+			Transform(equations[1], cached_math_tex(order_tex).move_to(step[1])),
+			Transform(equations[5], cached_math_tex(order_tex).move_to(step[5]))
 		)
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"\text{lcm}(",
-			r"2^3, 5^3",
+			parts_tex,
 			")&=",
-			r"2^3 \cdot 5^3",
+			product_tex,
 			r"\\",
-			r"2^3 + 5^3",
+			sum_tex,
 			"&= n"
 		)
 		self.wait(7)
 		self.play(
 			*[ApplyMethod(equations[index].move_to, step[index]) for index in [0, 2, 3, 4, 6]],
-			Transform(equations[1], MathTex(r"2^3, 5^3").move_to(step[1])),
-			Transform(equations[5], MathTex(r"2^3 + 5^3").move_to(step[5]))
+			Transform(equations[1], cached_math_tex(parts_tex).move_to(step[1])),
+			Transform(equations[5], cached_math_tex(sum_tex).move_to(step[5]))
 		)
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"\text{lcm}(",
-			r"2^3, 5^3",
+			parts_tex,
 			")&=",
-			r"2^3 \cdot 5^3",
+			product_tex,
 			r"\\",
-			r"133",
+			degree_tex,
 			"&= n"
 		)
 
 		self.play(
 			*[ApplyMethod(equations[index].move_to, step[index]) for index in [0, 1, 2, 3, 4, 6]],
-			Transform(equations[5], MathTex(r"133").move_to(step[5]))
+			Transform(equations[5], cached_math_tex(degree_tex).move_to(step[5]))
 		)
 		self.wait(14)
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"\text{lcm}(",
 			r"c_1, c_2, c_3, c_4, \dots, c_m",
 			")&=",
-			r"2^3 \cdot 5^3",
+			product_tex,
 			r"\\",
 			r"c_1 + c_2 + c_3 + c_4 + \dots + c_m",
 			"&= n"
 		)
 		self.play(
 			*[ApplyMethod(equations[index].move_to, step[index]) for index in [0, 2, 3, 4, 6]],
-			Transform(equations[1], MathTex(r"c_1, c_2, c_3, c_4, \dots, c_m").move_to(step[1])),
-			Transform(equations[5], MathTex(r"c_1 + c_2 + c_3 + c_4 + \dots + c_m").move_to(step[5]))
+			Transform(equations[1], cached_math_tex(r"c_1, c_2, c_3, c_4, \dots, c_m").move_to(step[1])),
+			Transform(equations[5], cached_math_tex(r"c_1 + c_2 + c_3 + c_4 + \dots + c_m").move_to(step[5]))
 		)
 		self.wait(9)
 
-		equationsPart2 = MathTex(
+		equationsPart2 = cached_math_tex(
 			r"\text{lcm}(",
 			r"c_1", r",", r"c_2", r",", r"c_3", ",", "c_4", ",", r"\dots", r",", r"c_m",
-			r") &= 2^3 \cdot 5^3",
+			r") &= " + product_tex,
 			r"\\c_1 + c_2 + c_3 + c_4 + \dots + c_m &= n"
 		)
 
 		self.add(equationsPart2)
 		self.remove(equations)
 
-		vertical_ci = MathTex(
-			'c_1', '&=', '2', '^{a_1}', '5', r'^{b_1}', r'\geq ', r'5^{b_1}\\',
-			'c_2', '&=', '2', '^{a_2}', '5', r'^{b_2}', r'\geq ', r'2^{a_2}', r' + ', r'5^{b_2}\\',
-			'c_3', '&=', '2', '^{a_3}', '5', r'^{b_3}', r'\geq ', r'2^{a_3}\\',
-			'c_4', '&=', '2', '^{a_4}', '5', r'^{b_4}', r'\geq ', r'5^{b_4}\\',
+		vertical_ci = cached_math_tex(
+			'c_1', '&=', p, '^{a_1}', q, r'^{b_1}', r'\geq ', rf'{q}^{{b_1}}\\',
+			'c_2', '&=', p, '^{a_2}', q, r'^{b_2}', r'\geq ', rf'{p}^{{a_2}}', r' + ', rf'{q}^{{b_2}}\\',
+			'c_3', '&=', p, '^{a_3}', q, r'^{b_3}', r'\geq ', rf'{p}^{{a_3}}\\',
+			'c_4', '&=', p, '^{a_4}', q, r'^{b_4}', r'\geq ', rf'{q}^{{b_4}}\\',
 			r'\vdots \\',
-			'c_m', '&=', '2', '^{a_m}', '5', r'^{b_m}', r'\geq ', r'2^{a_m}', r' + ', r'5^{b_m}\\',
+			'c_m', '&=', p, '^{a_m}', q, r'^{b_m}', r'\geq ', rf'{p}^{{a_m}}', r' + ', rf'{q}^{{b_m}}\\',
 		).shift(UP + RIGHT)
 
-		step = MathTex(
-			'c_1', '&=', '2', '^{a_m}', '5', r'^{b_m}', r'\geq ', r'5^{b_m}\\',
-			'c_2', '&=', '2', '^{a_m}', '5', r'^{b_m}', r'\geq ', r'2^{a_m}', r' + ', r'5^{b_m}\\',
-			'c_3', '&=', '2', '^{a_m}', '5', r'^{b_m}', r'\geq ', r'2^{a_m}\\',
-			'c_4', '&=', '2', '^{a_m}', '5', r'^{b_m}', r'\geq ', r'5^{b_m}\\',
+		step = cached_math_tex(
+			'c_1', '&=', p, '^{a_m}', q, r'^{b_m}', r'\geq ', rf'{q}^{{b_m}}\\',
+			'c_2', '&=', p, '^{a_m}', q, r'^{b_m}', r'\geq ', rf'{p}^{{a_m}}', r' + ', rf'{q}^{{b_m}}\\',
+			'c_3', '&=', p, '^{a_m}', q, r'^{b_m}', r'\geq ', rf'{p}^{{a_m}}\\',
+			'c_4', '&=', p, '^{a_m}', q, r'^{b_m}', r'\geq ', rf'{q}^{{b_m}}\\',
 			r'\vdots \\',
-			'c_m', '&=', '2', '^{a_m}', '5', r'^{b_m}', r'\geq ', r'2^{a_m}', r' + ', r'5^{b_m}\\',
+			'c_m', '&=', p, '^{a_m}', q, r'^{b_m}', r'\geq ', rf'{p}^{{a_m}}', r' + ', rf'{q}^{{b_m}}\\',
 		).shift(UP + RIGHT)
 
 		for index in [6, 7, 14, 15, 16, 17, 24, 25, 32, 33, 41, 42, 43, 44]:
@@ -1069,7 +1100,7 @@ class Solving(Scene):
 
 		vertical_ci[34].set_x(vertical_ci[0].get_x())
 
-		lcm_expression = MathTex(r'\text{lcm}(c_1, c_2, c_3, c_4, \dots, c_m)', r'=', r'2^3 \cdot 5^3')
+		lcm_expression = cached_math_tex(r'\text{lcm}(c_1, c_2, c_3, c_4, \dots, c_m)', r'=', product_tex)
 		lcm_expression.shift((vertical_ci[36].get_x() - lcm_expression[1].get_x()) * RIGHT)
 		lcm_expression.set_y(vertical_ci[35].get_y() - (vertical_ci[0].get_y() - vertical_ci[8].get_y()))
 
@@ -1116,7 +1147,7 @@ class Solving(Scene):
 
 		self.wait(4)
 
-		inequality = MathTex(
+		inequality = cached_math_tex(
 			r"c_1",  # 0
 			r" + ",  # 1
 			r"c_2",  # 2
@@ -1129,21 +1160,21 @@ class Solving(Scene):
 			r" + ",  # 9
 			r"c_m",  # 10
 			r"\geq",  # 11
-			r"5^{b_1}",  # 12
+			rf"{q}^{{b_1}}",  # 12
 			r" + ",  # 13
-			r"2^{a_2}",  # 14
+			rf"{p}^{{a_2}}",  # 14
 			r" + ",  # 15
-			r"5^{b_2}",  # 16
+			rf"{q}^{{b_2}}",  # 16
 			r" + ",  # 17
-			r"2^{a_3}",  # 18
+			rf"{p}^{{a_3}}",  # 18
 			r" + ",  # 19
-			r"5^{b_4}",  # 20
+			rf"{q}^{{b_4}}",  # 20
 			r" + ",  # 21
 			r"\cdots",  # 22
 			r" + ",  # 23
-			r"2^{a_m}",  # 24
+			rf"{p}^{{a_m}}",  # 24
 			r" + ",  # 25
-			r"5^{b_m}",  # 26
+			rf"{q}^{{b_m}}",  # 26
 		).scale(0.8)
 
 		etc_copy = vertical_ci[34].copy()
@@ -1179,7 +1210,7 @@ class Solving(Scene):
 		)
 		self.play(FadeIn(inequality), FadeOut(vertical_ci))
 
-		grouped = MathTex(
+		grouped = cached_math_tex(
 			r"c_1",  # 0
 			r" + ",  # 1
 			r"c_2",  # 2
@@ -1193,25 +1224,25 @@ class Solving(Scene):
 			r"c_m",  # 10
 			r"\geq",  # 11
 			r"(",  # 12
-			r"2^{a_2}",  # 13
+			rf"{p}^{{a_2}}",  # 13
 			r" + ",  # 14
-			r"2^{a_3}",  # 15
+			rf"{p}^{{a_3}}",  # 15
 			r" + ",  # 16
 			r"\cdots",  # 17
 			r" + ",  # 18
-			r"2^{a_m}",  # 19
+			rf"{p}^{{a_m}}",  # 19
 			r")",  # 20
 			r" + ",  # 21
 			r"(",  # 22
-			r"5^{b_1}",  # 23
+			rf"{q}^{{b_1}}",  # 23
 			r" + ",  # 24
-			r"5^{b_2}",  # 25
+			rf"{q}^{{b_2}}",  # 25
 			r" + ",  # 26
-			r"5^{b_4}",  # 27
+			rf"{q}^{{b_4}}",  # 27
 			r" + ",  # 28
 			r"\cdots",  # 29
 			r" + ",  # 30
-			r"5^{b_m}",  # 31
+			rf"{q}^{{b_m}}",  # 31
 			r")",  # 32
 		).scale(0.7)
 
@@ -1250,9 +1281,9 @@ class Solving(Scene):
 		self.wait(3)
 
 		brace_under_2 = BraceBetweenPoints(grouped[12].get_center(), grouped[20].get_center())
-		brace_under_2_text = brace_under_2.get_tex(r"\geq 2^3").scale(0.7).shift(UP * 0.3)
+		brace_under_2_text = brace_under_2.get_tex(r"\geq " + power_texs[0]).scale(0.7).shift(UP * 0.3)
 		brace_under_5 = BraceBetweenPoints(grouped[22].get_center(), grouped[32].get_center())
-		brace_under_5_text = brace_under_5.get_tex(r"\geq 5^3").scale(0.7).shift(UP * 0.3)
+		brace_under_5_text = brace_under_5.get_tex(r"\geq " + power_texs[1]).scale(0.7).shift(UP * 0.3)
 
 		self.play(FadeIn(brace_under_2))
 		self.wait(3)
@@ -1263,7 +1294,7 @@ class Solving(Scene):
 		self.play(FadeIn(brace_under_5_text))
 		self.wait()
 
-		final_inequality_split = MathTex(
+		final_inequality_split = cached_math_tex(
 			r"c_1",  # 0
 			r" + ",  # 1
 			r"c_2",  # 2
@@ -1277,30 +1308,30 @@ class Solving(Scene):
 			r"c_m",  # 10
 			r"\geq",  # 11
 			r"(",  # 12
-			r"2^{a_2}",  # 13
+			rf"{p}^{{a_2}}",  # 13
 			r" + ",  # 14
-			r"2^{a_3}",  # 15
+			rf"{p}^{{a_3}}",  # 15
 			r" + ",  # 16
 			r"\cdots",  # 17
 			r" + ",  # 18
-			r"2^{a_m}",  # 19
+			rf"{p}^{{a_m}}",  # 19
 			r")",  # 20
 			r" + ",  # 21
 			r"(",  # 22
-			r"5^{b_1}",  # 23
+			rf"{q}^{{b_1}}",  # 23
 			r" + ",  # 24
-			r"5^{b_2}",  # 25
+			rf"{q}^{{b_2}}",  # 25
 			r" + ",  # 26
-			r"5^{b_4}",  # 27
+			rf"{q}^{{b_4}}",  # 27
 			r" + ",  # 28
 			r"\cdots",  # 29
 			r" + ",  # 30
-			r"5^{b_m}",  # 31
+			rf"{q}^{{b_m}}",  # 31
 			r")",  # 32
 			r"\geq",
-			r"2^3",
+			power_texs[0],
 			r"+",
-			r"5^3"
+			power_texs[1]
 		).scale(0.65)
 
 		self.play(
@@ -1315,27 +1346,27 @@ class Solving(Scene):
 			FadeOut(grouped)),
 		self.wait()
 
-		final_inequality_clumped = MathTex(
+		final_inequality_clumped = cached_math_tex(
 			r"c_1 + c_2 + c_3 + c_4 + \cdots + c_m",
 			r"\geq",
 			r"(",
-			r"2^{a_2} + 2^{a_3} + \cdots + 2^{a_m}",
+			rf"{p}^{{a_2}} + {p}^{{a_3}} + \cdots + {p}^{{a_m}}",
 			r")",
 			r" + ",
 			r"(",
-			r"5^{b_1} + 5^{b_2} + 5^{b_4} + \cdots + 5^{b_m}",
+			rf"{q}^{{b_1}} + {q}^{{b_2}} + {q}^{{b_4}} + \cdots + {q}^{{b_m}}",
 			r")",
 			r"\geq",
-			r"2^3 + 5^3"
+			sum_tex
 		).scale(0.65).move_to(final_inequality_split)
 
 		self.play(FadeIn(final_inequality_clumped))
 		self.play(FadeOut(final_inequality_split), FadeOut(brace_under_2_text), FadeOut(brace_under_5_text))
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"c_1 + c_2 + c_3 + c_4 + \cdots + c_m",
 			r"\geq",
-			r"2^3 + 5^3"
+			sum_tex
 		)
 
 		self.wait(2)
@@ -1346,10 +1377,10 @@ class Solving(Scene):
 			Transform(final_inequality_clumped[10], step[2]),
 		)
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"c_1 + c_2 + c_3 + c_4 + \cdots + c_m",
 			r"\geq",
-			r"133"
+			degree_tex
 		)
 
 		self.play(
@@ -1360,10 +1391,10 @@ class Solving(Scene):
 
 		self.wait(5)
 
-		step = MathTex(
+		step = cached_math_tex(
 			r"n",
 			r"\geq",
-			r"133"
+			degree_tex
 		)
 
 		self.play(
@@ -1376,35 +1407,33 @@ class Solving(Scene):
 		self.play(*[FadeOut(mobject) for mobject in self.mobjects])
 
 
-class ShowingValidPermutation(ZoomedScene, MovingCameraScene):
-	def permute(self, dot_loc, label_loc, *cycles, fadein_arrows=True, fadeout_arrows=True, foa=None):
+class ShowingValidPermutation(HeldFrameScene, ZoomedScene, MovingCameraScene):
+	order = ORDER
+
+	def permute(self, dots, labels, slots, hidden_slot, permutation, *cycles, fadein_arrows=True, fadeout_arrows=True, foa=None):
 		transforms = []
 		fade_in_arrows = []
 		fade_out_arrows = []
-		for cycle in cycles:
-			dots = cycle.dots
-			labels = cycle.labels
-			for index in range(len(dots)):
-				this_dot = dots[index - 1]
-				next_dot = dots[index]
-				this_label = labels[index - 1]
-				next_label = labels[index]
-
-				transforms.append(Transform(this_dot, next_dot))
-
-				if approx(this_label.get_center(), label_loc):
+		for cycle_order in permutation.cycles():
+			for index in range(len(cycle_order)):
+				this_item = cycle_order[index - 1]
+				next_item = cycle_order[index]
+				this_dot = dots[this_item]
+				next_dot = dots[next_item]
+				this_label = labels[this_item]
+				next_label = labels[next_item]
+				this_hidden = slots.slot(this_item) == hidden_slot
+				next_hidden = slots.slot(next_item) == hidden_slot
+
+				if this_hidden:
 					this_label.set_value(next_label.get_value() - 1)
 
 				target_label = this_label.copy().move_to(next_label.get_center())
-
-				if approx(next_label.get_center(), label_loc):
-					target_label.set_color(BLACK)
-				else:
-					target_label.set_color(WHITE)
+				target_label.set_color(BLACK if next_hidden else WHITE)
 
 				transforms.append(Transform(this_label, target_label))
 
-				if not (approx(next_dot.get_center(), dot_loc) or approx(this_dot.get_center(), dot_loc)):
+				if not (next_hidden or this_hidden):
 					arrow = make_arrow_between(this_dot, next_dot)
 					fade_in_arrows.append(FadeIn(arrow))
 					fade_out_arrows.append(FadeOut(arrow))
@@ -1412,7 +1441,9 @@ class ShowingValidPermutation(ZoomedScene, MovingCameraScene):
 		if fadein_arrows:
 			self.play(*fade_in_arrows)
 
-		self.play(*transforms)
+		# match_style carries the hidden dot's invisibility along to whichever dot moves into its slot
+		self.play(CycleRotate(*cycles, match_style=True), *transforms)
+		slots.advance(permutation)
 
 		if fadeout_arrows:
 			if foa is None:
@@ -1427,6 +1458,12 @@ class ShowingValidPermutation(ZoomedScene, MovingCameraScene):
 
 		num_points = 20
 
+		solution = least_degree_with_order(self.order)
+		# the smaller cycle is drawn in full, the larger one is drawn around the hidden 14th dot with a '...'
+		if len(solution.cycle_type) != 2 or not solution.cycle_type[0] < 13 < num_points < solution.degree:
+			raise ValueError(f'The optimal permutation for order {self.order} does not fit this layout')
+		small_cycle = solution.cycle_type[0]
+
 		dots = []
 		labels = []
 
@@ -1434,12 +1471,11 @@ class ShowingValidPermutation(ZoomedScene, MovingCameraScene):
 			p = circle.point_at_angle(angle)
 			d = Dot(point=p)
 			dots.append(d)
-			label = Integer(c + 1).move_to(p * 1.15).scale(0.5)
+			label = GlyphInteger(c + 1).move_to(p * 1.15).scale(0.5)
 			labels.append(label)
 
-		labels[-1] = Integer(133).move_to(labels[-1].get_center()).scale(0.5)
-		for c in range(2, 7, 1):
-			labels[-c] = Integer(134 - c).move_to(labels[-c].get_center()).scale(0.5)
+		for c in range(1, 7, 1):
+			labels[-c] = GlyphInteger(solution.degree + 1 - c).move_to(labels[-c].get_center()).scale(0.5)
 
 		# Hides the 14th dot and puts a '...' in its place
 		dot_loc = dots[13].get_center()
@@ -1454,24 +1490,21 @@ class ShowingValidPermutation(ZoomedScene, MovingCameraScene):
 		self.wait(2)
 		self.play(*[FadeIn(dot) for dot in dots], *[FadeIn(label) for label in labels], FadeIn(etc))
 
-		permutations = [
-			[0, 1, 2, 3, 4, 5, 6, 7, 0],
-			[8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 8]
-		]
+		permutation = Permutation.from_cycles([range(0, small_cycle), range(small_cycle, num_points)], num_points)
 
-		cycle1order = permutations[0]
-		cycle2order = permutations[1]
+		cycle1order = permutation.cycle_containing(0)
+		cycle2order = permutation.cycle_containing(small_cycle)
 
 		cycle1 = Cycle(
 			circle=circle.copy(),
-			dots=[dots[index] for index in cycle1order[:-1]],
-			labels=[labels[index] for index in cycle1order[:-1]]
+			dots=[dots[index] for index in cycle1order],
+			labels=[labels[index] for index in cycle1order]
 		)
 
 		cycle2 = Cycle(
 			circle=circle.copy(),
-			dots=[dots[index] for index in cycle2order[:-1]],
-			labels=[labels[index] for index in cycle2order[:-1]]
+			dots=[dots[index] for index in cycle2order],
+			labels=[labels[index] for index in cycle2order]
 		)
 
 		def etc_updater(mob):
@@ -1490,23 +1523,28 @@ class ShowingValidPermutation(ZoomedScene, MovingCameraScene):
 		cycle2.add_label_updaters()
 
 		# untangles the dots and arrows
-		self.play(*cycle1.untangle(), *cycle2.untangle())
+		self.play(cycle1.untangle(), cycle2.untangle())
 
 		etc.remove_updater(etc_updater)
 
 		cycle1.remove_label_updaters()
 		cycle2.remove_label_updaters()
 
-		dot_loc = dots[13].get_center()
-		label_loc = labels[13].get_center()
+		# dot 13 is still in its own slot, which is the one behind the '...'
+		slots = SlotTracker(num_points)
+		hidden_slot = 13
 
 		self.wait(3)
 
-		foa = self.permute(dot_loc, label_loc, cycle1, cycle2, fadein_arrows=True, fadeout_arrows=False)
+		foa = self.permute(
+			dots, labels, slots, hidden_slot, permutation, cycle1, cycle2, fadein_arrows=True, fadeout_arrows=False
+		)
 
-		self.permute(dot_loc, label_loc, cycle1, cycle2, fadein_arrows=False, fadeout_arrows=False)
+		self.permute(dots, labels, slots, hidden_slot, permutation, cycle1, cycle2, fadein_arrows=False, fadeout_arrows=False)
 
-		self.permute(dot_loc, label_loc, cycle1, cycle2, fadein_arrows=False, fadeout_arrows=True, foa=foa)
+		self.permute(
+			dots, labels, slots, hidden_slot, permutation, cycle1, cycle2, fadein_arrows=False, fadeout_arrows=True, foa=foa
+		)
 
 		self.wait(11)
 
@@ -1517,10 +1555,13 @@ class ShowingValidPermutation(ZoomedScene, MovingCameraScene):
 		)
 
 
-class Summarize(Scene):
+class Summarize(HeldFrameScene):
+	order = ORDER
+
 	def construct(self):
+		solution = least_degree_with_order(self.order)
 		summarize = Text("In conclusion:").shift(UP * 2)
-		equation = MathTex(
+		equation = cached_math_tex(
 			r"\min"
 			r"\{"
 			r"n\in \mathbb{N}: \exists f\in [n]^{[n]} "
@@ -1529,10 +1570,10 @@ class Summarize(Scene):
 			r") \land ( "
 			r"\min \{ k \in \mathbb{N}: f^k=\text{Id}"
 			r"\}"
-			r"=1000"
+			rf"={solution.order}"
 			r")"
 			r"\}"
-			r"=133."
+			rf"={solution.degree}."
 		).scale(0.6)
 
 		self.play(Write(summarize))
@@ -1541,15 +1582,17 @@ class Summarize(Scene):
 		self.play(FadeOut(summarize), FadeOut(equation))
 
 
-class ReshowProblem(Scene):
+class ReshowProblem(HeldFrameScene):
+	order = ORDER
+
 	def construct(self):
-		text_part1 = MathTex(
+		text_part1 = cached_math_tex(
 			r"\text{Find the least positive integer } n"
 			r"\text{ for which there exists a permutation } f \text{ on } n \text{ objects}"
 		).scale(0.6).shift(UP * 0.5)
-		text_part2 = MathTex(
-			r"\text{ such that } f^{1000} \text{ is the identity function}"
-			r"\text{ and } 1000 \text{ is the least positive integer for which this holds.}"
+		text_part2 = cached_math_tex(
+			rf"\text{{ such that }} f^{{{self.order}}} \text{{ is the identity function}}"
+			rf"\text{{ and }} {self.order} \text{{ is the least positive integer for which this holds.}}"
 		).scale(0.6)
 		self.play(FadeIn(text_part1), FadeIn(text_part2))
 		self.wait(5)
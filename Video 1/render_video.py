@@ -0,0 +1,355 @@
+import argparse
+import hashlib
+import importlib
+import inspect
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from manim import Scene, config, logger, tempconfig
+from manim.constants import FFMPEG_BIN, QUALITIES
+
+from clip_cache import clip_path, store_clip
+
+# (module, scene) pairs in the order they appear in the video
+MANIFEST = [
+	('preamble', 'Preamble'),
+	('intro', 'Logo'),
+	('proof', 'WriteQuestionToScreen'),
+	('proof', 'ExplainingPermutations'),
+	('proof', 'RotationPermutationWith1000'),
+	('proof', 'RotationPermutationWith4'),
+	('proof', 'BringingInto2Circles'),
+	('proof', 'BreakingCircleIntoCycles'),
+	('lcm', 'LCMExplanation'),
+	('proof', 'Solving'),
+	('proof', 'ShowingValidPermutation'),
+	('proof', 'Summarize'),
+	('proof', 'ReshowProblem'),
+]
+
+# long single-construct scenes that are split into chunks of plays when --chunks is given
+CHUNKED_SCENES = [
+	('proof', 'BringingInto2Circles'),
+	('proof', 'BreakingCircleIntoCycles'),
+	('proof', 'Solving'),
+]
+
+# scenes that come out the same in every video; they are rendered once and then spliced in from the clip cache
+CACHED_CLIPS = [
+	('intro', 'Logo'),
+]
+
+QUALITY_FLAGS = {settings['flag']: name for name, settings in QUALITIES.items() if settings['flag']}
+
+RenderResult = namedtuple('RenderResult', ['module_name', 'scene_name', 'movie_file', 'seconds', 'error'])
+ChunkResult = namedtuple('ChunkResult', ['start', 'end', 'movie_file', 'seconds', 'error', 'boundary_digests'])
+
+
+def discover_scenes(module_names):
+	# every Scene subclass defined in the given modules, keyed by (module, scene)
+	scenes = {}
+	for module_name in module_names:
+		module = importlib.import_module(module_name)
+		for name, value in vars(module).items():
+			if inspect.isclass(value) and issubclass(value, Scene) and value.__module__ == module_name:
+				scenes[module_name, name] = value
+	return scenes
+
+
+def check_manifest(manifest, scenes):
+	missing = [entry for entry in manifest if entry not in scenes]
+	if missing:
+		raise ValueError(f'The manifest lists scenes that do not exist: {missing}')
+	for module_name, scene_name in scenes:
+		if (module_name, scene_name) not in manifest:
+			logger.warning(f'{module_name}.{scene_name} is not in the manifest and will not be rendered')
+
+
+def quality_config(quality):
+	settings = QUALITIES[quality]
+	return {
+		'pixel_width': settings['pixel_width'],
+		'pixel_height': settings['pixel_height'],
+		'frame_rate': settings['frame_rate'],
+	}
+
+
+def scene_config(module, quality, media_dir):
+	return {
+		'input_file': module.__file__,
+		'media_dir': media_dir,
+		# manim writes its .tex, .dvi and .svg files in place, so each worker process typesets in a tex_dir of its own
+		'tex_dir': os.path.join(media_dir, 'Tex', f'worker_{os.getpid()}'),
+		**quality_config(quality)
+	}
+
+
+def render(scene, profile=False):
+	if not profile:
+		scene.render()
+		return
+	# imported here, since updater_profiler builds on watch_plays from this module
+	from updater_profiler import logged_updaters
+	with logged_updaters(scene):
+		scene.render()
+
+
+def render_scene(module_name, scene_name, quality, media_dir, profile=False):
+	# runs in a worker process; any failure is returned rather than raised so the other scenes carry on
+	start = time.perf_counter()
+	try:
+		module = importlib.import_module(module_name)
+		with tempconfig(scene_config(module, quality, media_dir)):
+			scene = getattr(module, scene_name)()
+			render(scene, profile)
+			movie_file = scene.renderer.file_writer.movie_file_path
+	except Exception:
+		return RenderResult(module_name, scene_name, None, time.perf_counter() - start, traceback.format_exc())
+	return RenderResult(module_name, scene_name, movie_file, time.perf_counter() - start, None)
+
+
+def watch_plays(scene, before_play=None, after_play=None):
+	# calls before_play(index) and after_play(index) around every play of the scene
+	renderer = scene.renderer
+	play = renderer.play
+
+	def watched_play(scene, *args, **kwargs):
+		index = renderer.num_plays
+		if before_play is not None:
+			before_play(index)
+		play(scene, *args, **kwargs)
+		if after_play is not None:
+			after_play(index)
+
+	renderer.play = watched_play
+
+
+def frame_digest(scene):
+	# what the scene looks like right now, independent of any static image left over from the last play
+	renderer = scene.renderer
+	renderer.static_image = None
+	renderer.update_frame(scene)
+	return hashlib.sha256(renderer.get_frame().tobytes()).hexdigest()
+
+
+def plan_scene(module_name, scene_name, quality, media_dir):
+	# a pass over construct that skips every play, so nothing but one frame per play is rasterized
+	module = importlib.import_module(module_name)
+	durations = []
+	with tempconfig({
+		**scene_config(module, quality, media_dir),
+		'write_to_movie': False,
+		'from_animation_number': sys.maxsize
+	}):
+		scene = getattr(module, scene_name)()
+		watch_plays(scene, after_play=lambda index: durations.append(scene.duration))
+		scene.render()
+	return durations
+
+
+def split_plays(durations, chunks):
+	# contiguous runs of plays with roughly equal running time
+	total = sum(durations)
+	bounds = [0]
+	elapsed = 0
+	for index, duration in enumerate(durations[:-1]):
+		elapsed += duration
+		# manim treats upto_animation_number=0 as unset, so the first chunk has to hold at least two plays
+		if len(bounds) < chunks and index >= 1 and elapsed >= total * len(bounds) / chunks:
+			bounds.append(index + 1)
+	bounds.append(len(durations))
+	return list(zip(bounds, bounds[1:]))
+
+
+def chunk_directory(media_dir, module_name, scene_name):
+	return os.path.join(media_dir, 'videos', module_name, 'chunks', scene_name)
+
+
+def render_chunk(module_name, scene_name, quality, media_dir, start, end, profile=False):
+	# replays construct without rasterizing up to play start, renders plays start to end - 1, and records the
+	# frame at each boundary so neighbouring chunks can be checked against each other
+	began = time.perf_counter()
+	boundary_digests = {}
+	try:
+		module = importlib.import_module(module_name)
+		with tempconfig({
+			**scene_config(module, quality, media_dir),
+			'video_dir': os.path.join(chunk_directory(media_dir, module_name, scene_name), f'{start:05}'),
+			'from_animation_number': start,
+			'upto_animation_number': end - 1
+		}):
+			scene = getattr(module, scene_name)()
+
+			def record_boundary(index):
+				if index in (start, end):
+					boundary_digests[index] = frame_digest(scene)
+
+			watch_plays(scene, before_play=record_boundary)
+			render(scene, profile)
+			movie_file = scene.renderer.file_writer.movie_file_path
+	except Exception:
+		return ChunkResult(start, end, None, time.perf_counter() - began, traceback.format_exc(), boundary_digests)
+	return ChunkResult(start, end, movie_file, time.perf_counter() - began, None, boundary_digests)
+
+
+def check_boundaries(chunk_results):
+	# the frame a chunk ends on must be exactly the frame the next chunk starts from
+	for previous, following in zip(chunk_results, chunk_results[1:]):
+		if previous.boundary_digests.get(previous.end) != following.boundary_digests.get(following.start):
+			return f'chunks meeting at play {following.start} do not start from the same frame'
+	return None
+
+
+def stitch_chunks(module_name, scene_name, media_dir, chunk_results, seconds):
+	error = next((result.error for result in chunk_results if result.error is not None), None)
+	if error is None:
+		error = check_boundaries(chunk_results)
+	if error is not None:
+		return RenderResult(module_name, scene_name, None, seconds, error)
+
+	movie_file = os.path.join(chunk_directory(media_dir, module_name, scene_name), f"{scene_name}{config['movie_file_extension']}")
+	try:
+		concatenate([result.movie_file for result in chunk_results], movie_file)
+	except subprocess.CalledProcessError:
+		return RenderResult(module_name, scene_name, None, seconds, traceback.format_exc())
+	return RenderResult(module_name, scene_name, movie_file, seconds, None)
+
+
+def cached_clips(manifest, quality, clip_dir):
+	# where each of CACHED_CLIPS in the manifest is, or would be, kept in the clip cache
+	if clip_dir is None:
+		return {}
+	scenes = discover_scenes(sorted({module_name for module_name, _ in CACHED_CLIPS}))
+	return {
+		entry: clip_path(clip_dir, scenes[entry], quality_config(quality))
+		for entry in manifest if entry in CACHED_CLIPS
+	}
+
+
+def render_all(manifest, quality, media_dir, jobs, chunks=1, clip_dir=None, profile=False):
+	chunked = [entry for entry in manifest if chunks > 1 and entry in CHUNKED_SCENES]
+	results = {}
+	clips = cached_clips(manifest, quality, clip_dir)
+	for entry, path in clips.items():
+		if os.path.exists(path):
+			results[entry] = RenderResult(*entry, path, 0.0, None)
+			logger.info(f'Splicing in {entry[0]}.{entry[1]} from {path}')
+	# every scene, plan and chunk runs in a fresh process, since the scenes keep state such as their counters on the
+	# class and a reused worker would start the next run from where the last one left it
+	with ProcessPoolExecutor(
+		max_workers=jobs, mp_context=multiprocessing.get_context('spawn'), max_tasks_per_child=1
+	) as executor:
+		started = {entry: time.perf_counter() for entry in chunked}
+		plans = {
+			entry: executor.submit(plan_scene, *entry, quality, media_dir)
+			for entry in chunked
+		}
+
+		futures = {
+			executor.submit(render_scene, *entry, quality, media_dir, profile): entry
+			for entry in manifest if entry not in chunked and entry not in results
+		}
+		chunk_futures = {entry: [] for entry in chunked}
+		for entry, plan in plans.items():
+			try:
+				durations = plan.result()
+			except Exception:
+				results[entry] = RenderResult(*entry, None, time.perf_counter() - started[entry], traceback.format_exc())
+				logger.error(f'Failed to plan {entry[0]}.{entry[1]}:\n{results[entry].error}')
+				continue
+			for start, end in split_plays(durations, chunks):
+				future = executor.submit(render_chunk, *entry, quality, media_dir, start, end, profile)
+				chunk_futures[entry].append(future)
+				futures[future] = entry
+
+		for future in as_completed(futures):
+			entry = futures[future]
+			if entry in chunked:
+				# stitched once, by whichever of its chunks is seen last
+				if entry in results or not all(chunk.done() for chunk in chunk_futures[entry]):
+					continue
+				chunk_results = [chunk.result() for chunk in chunk_futures[entry]]
+				result = stitch_chunks(*entry, media_dir, chunk_results, time.perf_counter() - started[entry])
+			else:
+				result = future.result()
+
+			results[entry] = result
+			if result.error is None and entry in clips:
+				store_clip(result.movie_file, clips[entry])
+			if result.error is None:
+				logger.info(f'Rendered {result.module_name}.{result.scene_name} in {result.seconds:.1f}s')
+			else:
+				logger.error(f'Failed to render {result.module_name}.{result.scene_name}:\n{result.error}')
+	return [results[entry] for entry in manifest]
+
+
+def concatenate(movie_files, output_file):
+	list_file = f'{output_file}.txt'
+	with open(list_file, 'w') as file:
+		for movie_file in movie_files:
+			file.write(f"file '{os.path.abspath(movie_file)}'\n")
+
+	command = [
+		FFMPEG_BIN,
+		'-y',
+		'-f', 'concat',
+		'-safe', '0',
+		'-i', list_file,
+		'-loglevel', config['ffmpeg_loglevel'].lower(),
+		'-c', 'copy',
+		output_file,
+	]
+	try:
+		subprocess.run(command, check=True)
+	finally:
+		os.remove(list_file)
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Render every scene of the video in parallel and join them in order.')
+	parser.add_argument('-q', '--quality', choices=sorted(QUALITY_FLAGS), default='l')
+	parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count())
+	parser.add_argument('--media_dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'media'))
+	parser.add_argument('-o', '--output', default='video.mp4')
+	parser.add_argument('--chunks', type=int, default=1, help='split each of CHUNKED_SCENES into this many chunks')
+	parser.add_argument(
+		'--clip_dir',
+		default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'clips'),
+		help='where CACHED_CLIPS are kept between videos'
+	)
+	parser.add_argument(
+		'--profile_updaters', action='store_true', help='log the most expensive updaters after every play'
+	)
+	parser.add_argument('--no_clip_cache', action='store_true', help='render CACHED_CLIPS again instead of splicing them in')
+	args = parser.parse_args()
+
+	check_manifest(MANIFEST, discover_scenes(sorted({module_name for module_name, _ in MANIFEST})))
+
+	start = time.perf_counter()
+	clip_dir = None if args.no_clip_cache else args.clip_dir
+	results = render_all(
+		MANIFEST, QUALITY_FLAGS[args.quality], args.media_dir, args.jobs, args.chunks, clip_dir, args.profile_updaters
+	)
+
+	for result in results:
+		status = 'ok' if result.error is None else 'FAILED'
+		logger.info(f'{result.module_name}.{result.scene_name:<30} {result.seconds:8.1f}s  {status}')
+	logger.info(f'Rendered {len(results)} scenes in {time.perf_counter() - start:.1f}s')
+
+	failed = [result for result in results if result.error is not None]
+	if failed:
+		logger.error(f'Not joining the video, {len(failed)} scenes failed')
+		sys.exit(1)
+
+	concatenate([result.movie_file for result in results], args.output)
+	logger.info(f'Video written to {args.output}')
+
+
+if __name__ == '__main__':
+	main()
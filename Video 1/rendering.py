@@ -0,0 +1,261 @@
+import hashlib
+import subprocess
+from collections import OrderedDict
+
+import numpy as np
+from manim import Scene, __version__, config, logger
+from manim.animation.animation import prepare_animation
+from manim.constants import FFMPEG_BIN
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.file_ops import is_webm_format, write_to_movie
+from manim.utils.iterables import remove_list_redundancies
+
+FRAME_CACHE_BYTES = 1 << 30
+# points and colors are compared to this many decimals, far below a pixel, so that floating point drift still matches
+STATE_DECIMALS = 4
+STYLE_ARRAYS = ['fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas', 'rgbas']
+
+
+def state_digest(mobjects, decimals=STATE_DECIMALS):
+	digest = hashlib.sha256()
+	for mobject in extract_mobject_family_members(mobjects, only_those_with_points=True):
+		digest.update(type(mobject).__name__.encode())
+		# adding 0.0 turns the -0.0 that rounding leaves behind into 0.0
+		digest.update((np.round(mobject.points, decimals) + 0.0).tobytes())
+		for name in STYLE_ARRAYS:
+			if hasattr(mobject, name):
+				digest.update((np.round(getattr(mobject, name), decimals) + 0.0).tobytes())
+	return digest.hexdigest()
+
+
+class HeldFrameFileWriter(SceneFileWriter):
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.held_frames = 0
+
+	def open_movie_pipe(self, file_path=None):
+		if self.held_frames < 2:
+			return super().open_movie_pipe(file_path=file_path)
+
+		# same encoder settings as a normal partial movie, but ffmpeg repeats the single frame it is sent
+		if file_path is None:
+			file_path = self.partial_movie_files[self.renderer.num_plays]
+		self.partial_movie_file_path = file_path
+
+		fps = config['frame_rate']
+		if fps == int(fps):
+			fps = int(fps)
+
+		command = [
+			FFMPEG_BIN,
+			'-y',
+			'-f', 'rawvideo',
+			'-s', '%dx%d' % (config['pixel_width'], config['pixel_height']),
+			'-pix_fmt', 'rgba',
+			'-r', str(fps),
+			'-i', '-',
+			'-an',
+			'-loglevel', config['ffmpeg_loglevel'].lower(),
+			'-metadata', f'comment=Rendered with Manim Community v{__version__}',
+			'-vf', f'loop=loop={self.held_frames - 1}:size=1:start=0',
+		]
+		if is_webm_format():
+			command += ['-vcodec', 'libvpx-vp9', '-auto-alt-ref', '0']
+		elif config['transparent']:
+			command += ['-vcodec', 'qtrle']
+		else:
+			command += ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p']
+		command += [file_path]
+		self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+
+class HeldFrameRenderer(CairoRenderer):
+	# A static wait is already rasterized once by manim; this also sends that frame to ffmpeg only once and
+	# lets ffmpeg hold it for the rest of the wait.
+	def init_scene(self, scene):
+		self.file_writer = HeldFrameFileWriter(self, scene.__class__.__name__)
+
+	def save_static_frame_data(self, scene, static_mobjects):
+		# called once per play, after the animations are compiled and before the movie pipe is opened
+		self.file_writer.held_frames = 0
+		if write_to_movie() and scene.is_current_animation_frozen_frame():
+			self.file_writer.held_frames = int(scene.duration / (1 / self.camera.frame_rate))
+		return super().save_static_frame_data(scene, static_mobjects)
+
+	def freeze_current_frame(self, duration):
+		if self.file_writer.held_frames < 2:
+			return super().freeze_current_frame(duration)
+
+		self.time += self.file_writer.held_frames / self.camera.frame_rate
+		if not self.skip_animations:
+			self.file_writer.write_frame(self.get_frame())
+		self.file_writer.held_frames = 0
+
+
+class FrameReuseRenderer(HeldFrameRenderer):
+	# A play given a reuse key reuses the frames of an earlier play as backgrounds, and only draws the volatile
+	# mobjects on top of them. The key names the animations; the earlier play must also have had the same
+	# animation types and duration, and started from the same digest of every steady mobject, rounded so that
+	# floating point drift still matches.
+	def __init__(self, *args, frame_cache_bytes=FRAME_CACHE_BYTES, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.volatile_mobjects = []
+		self.reuse_key = None
+		self.frame_cache = OrderedDict()
+		self.frame_cache_bytes = frame_cache_bytes
+		self.cached_bytes = 0
+		self.reused_plays = 0
+
+		self.play_key = None
+		self.recording = None
+		self.recording_bytes = 0
+		self.replay = None
+		self.frame_index = 0
+
+	def is_volatile(self, mobject):
+		return any(mobject is volatile for volatile in self.volatile_mobjects)
+
+	def steady(self, mobjects):
+		return [mobject for mobject in mobjects if not self.is_volatile(mobject)]
+
+	def volatile(self, mobjects):
+		return [mobject for mobject in mobjects if self.is_volatile(mobject)]
+
+	def play(self, scene, *args, **kwargs):
+		self.play_key = self.recording = self.replay = None
+		super().play(scene, *args, **kwargs)
+
+		if self.recording:
+			self.store_frames(self.play_key, self.recording)
+		self.play_key = self.recording = self.replay = None
+
+	def save_static_frame_data(self, scene, static_mobjects):
+		# called once per play, after the animations are compiled and before they begin
+		if not self.volatile_mobjects:
+			return super().save_static_frame_data(scene, static_mobjects)
+
+		self.frame_index = 0
+		if self.reuse_key is not None and not (self.skip_animations or scene.is_current_animation_frozen_frame()):
+			self.play_key = (
+				self.reuse_key,
+				tuple(type(animation).__name__ for animation in scene.animations),
+				scene.duration,
+				state_digest(self.steady(scene.mobjects))
+			)
+			if self.play_key in self.frame_cache:
+				self.frame_cache.move_to_end(self.play_key)
+				self.replay = self.frame_cache[self.play_key]
+				self.reused_plays += 1
+				logger.info(f'Animation {self.num_plays} : Reusing the frames of an identical earlier play')
+				# nothing steady is drawn while replaying, so there is no need for a static image
+				self.static_image = None
+				return None
+			self.recording = []
+			self.recording_bytes = 0
+
+		return super().save_static_frame_data(scene, self.steady(static_mobjects))
+
+	def render(self, scene, time, moving_mobjects):
+		if self.skip_animations or not self.volatile_mobjects:
+			return super().render(scene, time, moving_mobjects)
+
+		if self.replay is not None and self.frame_index < len(self.replay):
+			self.camera.set_frame_to_background(self.replay[self.frame_index])
+		elif self.replay is not None:
+			self.update_frame(scene, self.steady(scene.mobjects))
+		else:
+			self.update_frame(scene, self.steady(moving_mobjects))
+			if self.recording is not None:
+				self.record_frame(self.get_frame())
+		self.frame_index += 1
+
+		self.camera.capture_mobjects(self.volatile(scene.mobjects))
+		self.add_frame(self.get_frame())
+
+	def record_frame(self, frame):
+		self.recording.append(frame)
+		self.recording_bytes += frame.nbytes
+		# a play too long to ever fit in the cache is not worth holding on to
+		if self.recording_bytes > self.frame_cache_bytes:
+			self.recording = None
+
+	def store_frames(self, key, frames):
+		self.frame_cache[key] = frames
+		self.cached_bytes += sum(frame.nbytes for frame in frames)
+		while self.cached_bytes > self.frame_cache_bytes:
+			_, evicted = self.frame_cache.popitem(last=False)
+			self.cached_bytes -= sum(frame.nbytes for frame in evicted)
+
+
+class HeldFrameScene(Scene):
+	renderer_class = HeldFrameRenderer
+
+	def __init__(self, renderer=None, **kwargs):
+		self.stand_ins = []
+		super().__init__(renderer=renderer, **kwargs)
+		if renderer is None:
+			# the camera class is only settled once every base scene has run its __init__
+			self.renderer = self.renderer_class(camera_class=self.camera_class, skip_animations=self.skip_animations)
+			self.renderer.init_scene(self)
+
+	def add_mobjects_from_animations(self, animations):
+		# A group made only to animate mobjects that are already in the scene, like those CycleRotate and MoveCenters
+		# are given, would be added on top of everything and pull its members up with it. Instead it goes in just
+		# below its lowest member and leaves every member where it is; the camera draws each mobject at its last
+		# place in the scene, so nothing changes order. restore_stand_ins takes the group out again after the play.
+		for animation in animations:
+			group = animation.mobject
+			if group is None or not group.submobjects or any(group is mobject for mobject in self.mobjects):
+				continue
+			positions = {id(mobject): index for index, mobject in enumerate(self.mobjects)}
+			if not all(id(member) in positions for member in group.submobjects):
+				continue
+			self.mobjects.insert(min(positions[id(member)] for member in group.submobjects), group)
+			self.stand_ins.append(group)
+		super().add_mobjects_from_animations(animations)
+
+	def restore_stand_ins(self):
+		if self.stand_ins:
+			stand_in_ids = {id(group) for group in self.stand_ins}
+			# a member removed during the play splits its group into the other members, which are then listed twice;
+			# keeping the last of each is the order they were drawn in anyway
+			self.mobjects = remove_list_redundancies(
+				[mobject for mobject in self.mobjects if id(mobject) not in stand_in_ids]
+			)
+			self.stand_ins = []
+
+	def play(self, *args, **kwargs):
+		try:
+			super().play(*args, **kwargs)
+		finally:
+			self.restore_stand_ins()
+
+	def stage(self, *animations):
+		# jumps straight to the end of the animations, in order, the way play would leave them but without a play,
+		# so nothing is hashed, rendered or sent to ffmpeg; for layout that is never seen mid-animation
+		animations = [prepare_animation(animation) for animation in animations]
+		self.add_mobjects_from_animations(animations)
+		for animation in animations:
+			animation.begin()
+			animation.finish()
+			animation.clean_up_from_scene(self)
+		self.restore_stand_ins()
+
+
+class FrameReuseScene(HeldFrameScene):
+	renderer_class = FrameReuseRenderer
+
+	def declare_volatile(self, *mobjects):
+		# volatile mobjects are left out when matching plays and are always drawn on top
+		self.renderer.volatile_mobjects.extend(mobjects)
+
+	def play_repeatable(self, key, *args, **kwargs):
+		# key must stand for the animations, such as 'rotate' for one step of a permutation, while what is on screen
+		# is matched by its digest; only plays made through here are recorded or reused
+		self.renderer.reuse_key = key
+		try:
+			self.play(*args, **kwargs)
+		finally:
+			self.renderer.reuse_key = None
@@ -0,0 +1,192 @@
+import ast
+import atexit
+import hashlib
+import inspect
+import os
+import pickle
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+
+from manim import MathTex, Scene, __version__, config, logger
+
+
+class TexGeometryCache:
+	def __init__(self, directory=None):
+		self._directory = directory
+		self.prototypes = {}
+		self.memory_hits = 0
+		self.disk_hits = 0
+		self.misses = 0
+
+	@property
+	def directory(self):
+		# resolved lazily so that --media_dir from the command line is respected
+		if self._directory is None:
+			return os.path.join(config.media_dir, 'tex_geometry')
+		return self._directory
+
+	def key(self, mobject_class, tex_strings, kwargs):
+		tex_template = kwargs.get('tex_template', config['tex_template'])
+		settings = sorted((name, repr(value)) for name, value in kwargs.items() if name != 'tex_template')
+		description = repr((
+			__version__,
+			mobject_class.__name__,
+			tex_strings,
+			getattr(tex_template, 'body', repr(tex_template)),
+			settings
+		))
+		return hashlib.sha256(description.encode()).hexdigest()
+
+	def is_cached(self, mobject_class, *tex_strings, **kwargs):
+		key = self.key(mobject_class, tex_strings, kwargs)
+		return key in self.prototypes or os.path.exists(self.path(key))
+
+	def get(self, mobject_class, *tex_strings, **kwargs):
+		key = self.key(mobject_class, tex_strings, kwargs)
+
+		if key in self.prototypes:
+			self.memory_hits += 1
+			return self.prototypes[key].copy()
+
+		prototype = self.load(key)
+		if prototype is not None:
+			self.disk_hits += 1
+		else:
+			self.misses += 1
+			prototype = mobject_class(*tex_strings, **kwargs)
+			self.store(key, prototype)
+
+		self.prototypes[key] = prototype
+		return prototype.copy()
+
+	def path(self, key):
+		return os.path.join(self.directory, key[:2], key + '.pickle')
+
+	def load(self, key):
+		try:
+			with open(self.path(key), 'rb') as file:
+				return pickle.load(file)
+		except FileNotFoundError:
+			return None
+		except (pickle.UnpicklingError, EOFError, AttributeError) as error:
+			logger.debug(f'Ignoring unreadable tex geometry cache entry {key}: {error}')
+			return None
+
+	def store(self, key, prototype):
+		path = self.path(key)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		# written under a temporary name first so that concurrent renders never read half a file
+		temporary_path = f'{path}.{os.getpid()}.tmp'
+		try:
+			with open(temporary_path, 'wb') as file:
+				pickle.dump(prototype, file, protocol=pickle.HIGHEST_PROTOCOL)
+			os.replace(temporary_path, path)
+		except (pickle.PicklingError, TypeError, AttributeError) as error:
+			logger.debug(f'Could not store tex geometry cache entry {key}: {error}')
+			if os.path.exists(temporary_path):
+				os.remove(temporary_path)
+
+	def stats(self):
+		lookups = self.memory_hits + self.disk_hits + self.misses
+		return {
+			'lookups': lookups,
+			'memory_hits': self.memory_hits,
+			'disk_hits': self.disk_hits,
+			'misses': self.misses,
+			'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+		}
+
+	def log_stats(self):
+		stats = self.stats()
+		if stats['lookups']:
+			logger.info(
+				f"Tex geometry cache: {stats['lookups']} lookups, {stats['memory_hits']} memory hits, "
+				f"{stats['disk_hits']} disk hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)"
+			)
+
+
+tex_geometry_cache = TexGeometryCache()
+atexit.register(tex_geometry_cache.log_stats)
+
+
+def cached_math_tex(*tex_strings, **kwargs):
+	return tex_geometry_cache.get(MathTex, *tex_strings, **kwargs)
+
+
+def tex_value(node, names):
+	# a literal, or an expression over the given names only, such as an f-string of solver results
+	return eval(compile(ast.Expression(node), '<tex>', 'eval'), {'__builtins__': {}}, dict(names))
+
+
+def tex_calls_in_source(source, names=None):
+	# every cached_math_tex/MathTex call in source whose arguments are literals or expressions over names, as
+	# (tex_strings, kwargs), and the number of calls left out because they depend on anything else
+	calls = []
+	skipped = 0
+	for node in ast.walk(ast.parse(textwrap.dedent(source))):
+		if not (isinstance(node, ast.Call) and getattr(node.func, 'id', None) in ('cached_math_tex', 'MathTex')):
+			continue
+		try:
+			tex_strings = []
+			for arg in node.args:
+				if isinstance(arg, ast.Starred):
+					tex_strings.extend(tex_value(arg.value, names or {}))
+				else:
+					tex_strings.append(tex_value(arg, names or {}))
+			kwargs = {keyword.arg: tex_value(keyword.value, names or {}) for keyword in node.keywords}
+		except Exception:
+			skipped += 1
+			continue
+		if None in kwargs or not all(isinstance(tex_string, str) for tex_string in tex_strings):
+			skipped += 1
+			continue
+		call = (tuple(tex_strings), kwargs)
+		if call not in calls:
+			calls.append(call)
+	return calls, skipped
+
+
+def _use_worker_tex_dir(tex_dir):
+	# manim typesets every substring of a MathTex on its own and writes its .tex, .dvi and .svg files in place, so
+	# workers sharing a tex_dir would race on the substrings their calls have in common
+	config.tex_dir = os.path.join(tex_dir, f'worker_{os.getpid()}')
+
+
+def _compile_tex_call(call):
+	tex_strings, kwargs = call
+	try:
+		cached_math_tex(*tex_strings, **kwargs)
+	except Exception as error:
+		return f'{tex_strings!r}: {error}'
+	return None
+
+
+def precompile_tex(calls, max_workers=None):
+	missing = [
+		(tex_strings, kwargs) for tex_strings, kwargs in calls
+		if not tex_geometry_cache.is_cached(MathTex, *tex_strings, **kwargs)
+	]
+	if len(missing) < 2:
+		return
+
+	logger.info(f'Precompiling {len(missing)} tex strings in parallel')
+	with ProcessPoolExecutor(
+		max_workers=max_workers, initializer=_use_worker_tex_dir, initargs=(config.get_dir('tex_dir'),)
+	) as executor:
+		for error in executor.map(_compile_tex_call, missing):
+			# the real construct will raise this again with a proper traceback
+			if error is not None:
+				logger.warning(f'Could not precompile {error}')
+
+
+class PrecompiledTexScene(Scene):
+	def setup(self):
+		super().setup()
+		calls, skipped = tex_calls_in_source(inspect.getsource(type(self)), self.tex_names())
+		if skipped:
+			logger.info(f'{type(self).__name__}: {skipped} tex calls are not precompiled and are typeset during construct')
+		precompile_tex(calls)
+
+	def tex_names(self):
+		# the values of the names that construct builds its tex strings from, so that those calls are precompiled too
+		return {}
@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from manim import Mobject, logger
+
+from render_video import watch_plays
+
+HOTTEST_UPDATERS = 5
+
+
+class ProfiledUpdater:
+	# Stands in for an updater in mobject.updaters. It compares equal to the function it wraps, so
+	# remove_updater(function) still works, and it exposes that function's signature through __wrapped__,
+	# so updaters taking dt are still recognized as time based.
+	def __init__(self, profiler, function, tag):
+		self.profiler = profiler
+		self.__wrapped__ = function
+		self.tag = tag
+
+	def __call__(self, *args, **kwargs):
+		start = time.perf_counter()
+		try:
+			return self.__wrapped__(*args, **kwargs)
+		finally:
+			self.profiler.record(self.tag, time.perf_counter() - start)
+
+	def __eq__(self, other):
+		return other is self or other is self.__wrapped__
+
+	def __hash__(self):
+		return hash(self.__wrapped__)
+
+	def __deepcopy__(self, memo):
+		# copies of a mobject share its updaters, as they would without profiling
+		return self
+
+
+class UpdaterProfiler:
+	def __init__(self, log_plays=False):
+		# tag -> [calls, seconds]; a tag is (registration site, updater name, owning mobject class)
+		self.log_plays = log_plays
+		self.totals = {}
+		self.plays = []
+		self.current_play = None
+		self.owners = {}
+		self.original_add_updater = None
+
+	def install(self):
+		profiler = self
+		add_updater = self.original_add_updater = Mobject.add_updater
+
+		def profiled_add_updater(mobject, update_function, index=None, call_updater=False):
+			if not isinstance(update_function, ProfiledUpdater):
+				caller = sys._getframe(1)
+				site = f'{os.path.basename(caller.f_code.co_filename)}:{caller.f_lineno}'
+				name = getattr(update_function, '__qualname__', repr(update_function))
+				tag = (site, name, type(mobject).__name__)
+				profiler.owners.setdefault(tag, set()).add(id(mobject))
+				update_function = ProfiledUpdater(profiler, update_function, tag)
+			return add_updater(mobject, update_function, index=index, call_updater=call_updater)
+
+		Mobject.add_updater = profiled_add_updater
+		return self
+
+	def uninstall(self):
+		if self.original_add_updater is not None:
+			Mobject.add_updater = self.original_add_updater
+			self.original_add_updater = None
+
+	def record(self, tag, seconds):
+		for stats in (self.totals, self.current_play):
+			if stats is None:
+				continue
+			entry = stats.setdefault(tag, [0, 0.0])
+			entry[0] += 1
+			entry[1] += seconds
+
+	def begin_play(self, index):
+		self.current_play = {}
+
+	def end_play(self, index):
+		self.plays.append(self.current_play)
+		self.current_play = None
+		if self.log_plays:
+			self.log_play(index, self.plays[-1])
+
+	def hottest(self, stats, count=HOTTEST_UPDATERS):
+		ranked = sorted(stats.items(), key=lambda item: item[1][1], reverse=True)[:count]
+		return [
+			{
+				'site': site,
+				'updater': name,
+				'owner': owner,
+				'mobjects': len(self.owners.get((site, name, owner), ())),
+				'calls': calls,
+				'seconds': seconds,
+			}
+			for (site, name, owner), (calls, seconds) in ranked
+		]
+
+	def report(self, count=HOTTEST_UPDATERS):
+		return {
+			'total': self.hottest(self.totals, count),
+			'plays': [self.hottest(stats, count) for stats in self.plays],
+		}
+
+	def log_play(self, index, stats, count=HOTTEST_UPDATERS):
+		for entry in self.hottest(stats, count):
+			logger.info(
+				f"Animation {index} : {entry['seconds'] * 1000:8.1f}ms in {entry['calls']:6} calls of "
+				f"{entry['updater']} on {entry['mobjects']} {entry['owner']} ({entry['site']})"
+			)
+
+
+def profile_updaters(scene, log_plays=False):
+	# wraps every updater registered from here on and splits the timings by play; call before scene.render() and
+	# uninstall the profiler once it is done
+	profiler = UpdaterProfiler(log_plays).install()
+	watch_plays(scene, before_play=profiler.begin_play, after_play=profiler.end_play)
+	return profiler
+
+
+@contextmanager
+def logged_updaters(scene):
+	# logs the most expensive updaters after every play of the scene rendered within this block
+	profiler = profile_updaters(scene, log_plays=True)
+	try:
+		yield profiler
+	finally:
+		profiler.uninstall()